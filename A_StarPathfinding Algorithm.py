@@ -37,6 +37,75 @@ We maintain an open list (nodes to explore) and a closed list (already explored
 For each node, we calculate its neighbors and update their costs.
 We backtrack to find the path once the goal is reached.
 
+Array Engine:
+a_star(grid, start, goal, engine="array") runs the same search on a NumPy grid.
+Cells are addressed by a flat id (row * cols + col), and g-scores and parent
+pointers live in flat integer arrays indexed by that id instead of Node objects.
+Heap entries are plain (f, h, cell) tuples; a neighbor is only pushed when it
+improves its best known g, and stale entries are skipped when popped (lazy deletion).
+
+Jump Point Search:
+On grids with uniform move cost many shortest paths are symmetric, so plain A*
+expands every cell of a corridor. jump_point_search prunes those expansions:
+from each expanded cell it "jumps" in a straight (or diagonal) line until it hits
+a cell with a forced neighbor or the goal, and only that jump point is pushed.
+It supports 4-connected moves (Manhattan heuristic, same path lengths as a_star)
+and 8-connected moves without corner cutting (octile heuristic, diagonal cost sqrt(2)).
+Straight jumps are found with bytes.find on the grid's bytes (jump_along_row), because
+4-connected vertical jumps probe both horizontal directions at every step; scanning
+each of those rows in Python made a single vertical jump cost O(rows * cols).
+
+Bidirectional A*:
+bidirectional_a_star grows one frontier from the start (heading for the goal) and one
+from the goal (heading for the start), always expanding the smaller frontier.
+Whenever a cell is reached by both sides the meeting cost is recorded, and the search
+stops once that cost is no larger than the smallest f on either frontier, because every
+path not yet seen must pass through a frontier cell. The two half paths are stitched
+together at the meeting cell.
+
+Landmark (ALT) Heuristic:
+For repeated queries on the same static grid, LandmarkHeuristic.build picks a few
+landmark cells far apart from each other and stores the exact BFS distance from each
+landmark to every cell in a NumPy table. By the triangle inequality
+|d(L, n) - d(L, goal)| never overestimates the remaining cost, so the largest of these
+values (and the Manhattan distance) is a tighter lower bound around obstacles. The
+tables can be saved with save() and loaded with LandmarkHeuristic.load(), and the
+object is passed to a_star through the heuristic_fn parameter.
+
+Hierarchical Pathfinding (HPA*):
+HierarchicalGrid splits the grid into square clusters. Along every border between two
+clusters, each run of cells that is open on both sides becomes an entrance: one pair of
+abstract nodes in the middle of a short run, or two pairs at the ends of a long one.
+Inside each cluster the costs between its abstract nodes are precomputed with a grid
+search restricted to that cluster. A query connects start and goal to the nodes of their
+clusters, runs A* over this small abstract graph and then refines only the chosen
+segments with a_star_array inside one cluster each. Paths are close to optimal but not
+guaranteed optimal. set_cell rebuilds only the cluster holding the changed cell (and the
+neighbor clusters whose shared border it lies on).
+
+Incremental Replanning (D* Lite):
+DStarLite searches backwards from the goal and keeps its g and rhs values between calls.
+When cells flip between walkable and obstacle, update_cells only resets the rhs of those
+cells and their neighbors and puts the inconsistent ones back on the queue, so the repair
+touches the part of the search the change affects instead of the whole map. move_to
+advances the start cell as the robot moves; the key modifier km keeps old queue keys valid.
+
+Weighted and Anytime A* (ARA*):
+Inflating the heuristic, f(n) = g(n) + w * h(n), makes A* head for the goal greedily and
+finds a path at most w times longer than the shortest one after far fewer expansions.
+anytime_a_star is a generator: it first yields the path found with a large w, then lowers w
+step by step, reusing the g values already found (cells improved after being expanded are
+kept in an INCONS list instead of being re-expanded in the same round). Each round that
+shortens the path or tightens its guarantee yields (path, bound), where bound is a proven
+upper limit on cost / optimal cost, until the bound reaches 1, the time budget runs out or
+the node budget is spent. weighted_a_star returns only the first path.
+
+Batch Solving Over a Process Pool:
+solve_batch plans many (start, goal) queries on one grid at once. The obstacle grid is
+copied into a multiprocessing.shared_memory block a single time; every worker process
+attaches to that block when it starts, so tasks only carry the two coordinates and the
+grid is never pickled per query. Results come back in the order of the input queries.
+
 Output
 Finding the shortest path using A*...
 Shortest path found: [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (3, 2), (4, 2), (4, 3), (4, 4)]
@@ -55,6 +124,11 @@ Try using larger grids to see how the algorithm scales with more complex maps.
 
 import heapq
 import math
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
 
 # Node class to store information for each cell
 class Node:
@@ -72,7 +146,13 @@ def heuristic(a, b):
     """Calculate the Manhattan distance between two points."""
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-def a_star(grid, start, goal):
+def octile_heuristic(a, b):
+    """Calculate the octile distance between two points (8-connected moves, diagonal cost sqrt(2))."""
+    dx = abs(a[0] - b[0])
+    dy = abs(a[1] - b[1])
+    return max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy)
+
+def a_star(grid, start, goal, engine="node", heuristic_fn=heuristic):
     """
     A* algorithm to find the shortest path in a grid.
     
@@ -80,10 +160,25 @@ def a_star(grid, start, goal):
     grid (list of list of int): 2D grid where 0 is walkable and 1 is an obstacle.
     start (tuple): Starting coordinates (x, y).
     goal (tuple): Goal coordinates (x, y).
+    engine (str): "node" for the Node based search, "array" for a_star_array,
+                  "jps" for 4-connected jump_point_search, "bidirectional" for bidirectional_a_star.
+    heuristic_fn (callable): Lower bound h(position, goal), Manhattan distance by default.
+                             A LandmarkHeuristic can be passed here. "jps" only supports the default.
     
     Returns:
     list of tuple: Shortest path from start to goal, or an empty list if no path is found.
     """
+    if engine == "array":
+        return a_star_array(grid, start, goal, heuristic_fn=heuristic_fn)
+    if engine == "jps":
+        if heuristic_fn is not heuristic:
+            raise ValueError("Jump Point Search only supports the default heuristic")
+        return jump_point_search(grid, start, goal)
+    if engine == "bidirectional":
+        return bidirectional_a_star(grid, start, goal, heuristic_fn=heuristic_fn)
+    if engine != "node":
+        raise ValueError(f"Unknown A* engine: {engine!r}")
+
     open_list = []
     closed_list = set()
     
@@ -117,13 +212,1262 @@ def a_star(grid, start, goal):
             
             neighbor_node = Node(neighbor_pos, current_node)
             neighbor_node.g = current_node.g + 1
-            neighbor_node.h = heuristic(neighbor_pos, goal)
+            neighbor_node.h = heuristic_fn(neighbor_pos, goal)
             neighbor_node.f = neighbor_node.g + neighbor_node.h
             
             heapq.heappush(open_list, neighbor_node)
     
     return []  # No path found
 
+def as_grid_array(grid):
+    """
+    Convert a grid to a contiguous 2D NumPy array of obstacle flags.
+    
+    Parameters:
+    grid (list of list of int or numpy.ndarray): 2D grid where 0 is walkable and 1 is an obstacle.
+    
+    Returns:
+    numpy.ndarray: uint8 array of the same shape, 1 for obstacles and 0 elsewhere.
+                   A contiguous uint8 array of 0s and 1s is returned as is, not copied.
+    """
+    grid = np.asarray(grid)
+    if grid.ndim != 2:
+        raise ValueError("grid must be two-dimensional")
+    if grid.dtype == np.uint8 and grid.flags.c_contiguous and grid.max(initial=0) <= 1:
+        return grid  # Already in this form (for example a shared memory view), no copy
+    return np.ascontiguousarray(grid == 1, dtype=np.uint8)
+
+def index_dtype(size):
+    """Smallest NumPy integer type able to hold every cell id of a grid with `size` cells."""
+    return np.int32 if size < 2**31 - 1 else np.int64
+
+def trace_path(parent, cell, cols):
+    """
+    Follow flat parent pointers back from `cell` and return the path as (row, col) tuples.
+    
+    Parameters:
+    parent (sequence of int): Parent cell id for each cell, -1 marks the start.
+    cell (int): Cell id where the path ends.
+    cols (int): Number of columns in the grid.
+    
+    Returns:
+    list of tuple: Path from the start cell to `cell`.
+    """
+    path = []
+    while cell != -1:
+        path.append(divmod(cell, cols))
+        cell = parent[cell]
+    return path[::-1]
+
+def a_star_array(grid, start, goal, stats=None, heuristic_fn=None):
+    """
+    Array-backed A* on a NumPy grid with best-g tracking and lazy deletion.
+    
+    g-scores and parent pointers are kept in flat arrays indexed by cell id
+    (row * cols + col), and the open list holds plain (f, h, g, cell) tuples. A neighbor is pushed only when it improves its best known g, so
+    each cell has at most a handful of heap entries instead of one per visit.
+    
+    Parameters:
+    grid (numpy.ndarray or list of list of int): 2D grid where 0 is walkable and 1 is an obstacle.
+    start (tuple): Starting coordinates (x, y).
+    goal (tuple): Goal coordinates (x, y).
+    stats (dict): Optional dict that receives the "expanded" and "pushed" counters.
+    heuristic_fn (callable): Optional lower bound h(position, goal); None uses the inlined Manhattan distance.
+    
+    Returns:
+    list of tuple: Shortest path from start to goal, or an empty list if no path is found.
+    """
+    cells = as_grid_array(grid)
+    rows, cols = cells.shape
+    if not (0 <= start[0] < rows and 0 <= start[1] < cols):
+        return []
+    if not (0 <= goal[0] < rows and 0 <= goal[1] < cols):
+        return []
+
+    size = rows * cols
+    g_score = np.full(size, np.inf)  # float64, so heuristics may return floats
+    parent = np.full(size, -1, dtype=index_dtype(size))
+
+    # memoryviews give fast scalar access to the NumPy buffers
+    blocked = memoryview(cells.reshape(-1))
+    g_view = memoryview(g_score)
+    parent_view = memoryview(parent)
+
+    goal_row, goal_col = goal
+    start_cell = start[0] * cols + start[1]
+    goal_cell = goal_row * cols + goal_col
+
+    g_view[start_cell] = 0
+    h = heuristic(start, goal) if heuristic_fn is None else heuristic_fn(start, goal)
+    open_list = [(h, h, 0, start_cell)] if h != math.inf else []
+    expanded = 0
+    pushed = len(open_list)
+
+    while open_list:
+        f, h, g, cell = heapq.heappop(open_list)
+        if g > g_view[cell]:
+            continue  # Stale entry, a cheaper route was found after this push
+
+        if cell == goal_cell:
+            break
+        expanded += 1
+
+        row, col = divmod(cell, cols)
+        next_g = g + 1
+
+        # Neighbors in the same order as a_star: right, down, left, up
+        for neighbor_row, neighbor_col, neighbor in (
+            (row, col + 1, cell + 1),
+            (row + 1, col, cell + cols),
+            (row, col - 1, cell - 1),
+            (row - 1, col, cell - cols),
+        ):
+            if not (0 <= neighbor_row < rows and 0 <= neighbor_col < cols):
+                continue  # Skip out of bounds positions
+            if blocked[neighbor]:
+                continue  # Skip obstacles
+
+            if g_view[neighbor] <= next_g:
+                continue  # Already reached at least as cheaply
+
+            if heuristic_fn is None:
+                neighbor_h = abs(neighbor_row - goal_row) + abs(neighbor_col - goal_col)
+            else:
+                neighbor_h = heuristic_fn((neighbor_row, neighbor_col), goal)
+                if neighbor_h == math.inf:
+                    continue  # The goal cannot be reached from this cell
+
+            g_view[neighbor] = next_g
+            parent_view[neighbor] = cell
+            heapq.heappush(open_list, (next_g + neighbor_h, neighbor_h, next_g, neighbor))
+            pushed += 1
+    else:
+        cell = -1
+
+    if stats is not None:
+        stats["expanded"] = expanded
+        stats["pushed"] = pushed
+
+    if cell == -1:
+        return []  # No path found
+    return trace_path(parent_view, cell, cols)
+
+def expand_jump_path(jump_points):
+    """
+    Fill in the straight or diagonal runs between consecutive jump points.
+    
+    Parameters:
+    jump_points (list of tuple): Jump points from start to goal.
+    
+    Returns:
+    list of tuple: Cell by cell path visiting every jump point.
+    """
+    path = jump_points[:1]
+    for (row, col), (next_row, next_col) in zip(jump_points, jump_points[1:]):
+        step_row = (next_row > row) - (next_row < row)
+        step_col = (next_col > col) - (next_col < col)
+        while (row, col) != (next_row, next_col):
+            row += step_row
+            col += step_col
+            path.append((row, col))
+    return path
+
+def jump_along_row(data, width, cell, step, goal_cell):
+    """
+    Straight jump along a row of a padded grid, using bytes.find instead of a Python loop.
+    
+    The jump stops at the first obstacle (no jump point), the goal, or a forced neighbor:
+    a free cell above or below whose predecessor along the row is blocked, which shows up
+    in the bytes of that row as a 1 -> 0 step. Each search runs at C speed.
+    
+    Parameters:
+    data (bytes): Padded grid, one byte per cell (1 for obstacles), row by row.
+    width (int): Length of a row, including the border.
+    cell (int): Flat id of the cell the jump starts from.
+    step (int): 1 to jump right, -1 to jump left.
+    goal_cell (int): Flat id of the goal.
+    
+    Returns:
+    int: Flat id of the jump point, or -1 if the jump runs into an obstacle.
+    """
+    if step == 1:
+        wall = data.find(b"\x01", cell + 1)  # The border ends every row
+        stop = wall
+        above = data.find(b"\x01\x00", cell - width, wall - width)
+        if above != -1:
+            stop = above + 1 + width
+        below = data.find(b"\x01\x00", cell + width, wall + width)
+        if below != -1 and below + 1 - width < stop:
+            stop = below + 1 - width
+        if cell < goal_cell < stop:
+            stop = goal_cell
+    else:
+        wall = data.rfind(b"\x01", 0, cell)
+        stop = wall
+        above = data.rfind(b"\x00\x01", wall + 1 - width, cell + 1 - width)
+        if above != -1:
+            stop = above + width
+        below = data.rfind(b"\x00\x01", wall + 1 + width, cell + 1 + width)
+        if below != -1 and below - width > stop:
+            stop = below - width
+        if stop < goal_cell < cell:
+            stop = goal_cell
+    return -1 if stop == wall else stop
+
+def jump_point_search(grid, start, goal, diagonal=False, stats=None):
+    """
+    Jump Point Search for grids with uniform move cost.
+    
+    Only jump points (cells with forced neighbors, the start and the goal) are
+    pushed on the open list; the cells in between are skipped by scanning along
+    straight or diagonal lines. The returned path is expanded back into single steps.
+    
+    Parameters:
+    grid (numpy.ndarray or list of list of int): 2D grid where 0 is walkable and 1 is an obstacle.
+    start (tuple): Starting coordinates (x, y).
+    goal (tuple): Goal coordinates (x, y).
+    diagonal (bool): False for 4-connected moves, True for 8-connected moves
+                     (a diagonal step needs both adjacent orthogonal cells walkable).
+    stats (dict): Optional dict that receives the "expanded" and "pushed" counters.
+    
+    Returns:
+    list of tuple: Shortest path from start to goal, or an empty list if no path is found.
+    """
+    cells = as_grid_array(grid)
+    rows, cols = cells.shape
+    if not (0 <= start[0] < rows and 0 <= start[1] < cols):
+        return []
+    if not (0 <= goal[0] < rows and 0 <= goal[1] < cols):
+        return []
+
+    # A border of obstacles around the grid removes the bounds checks from the scans
+    padded = np.pad(cells, 1, constant_values=1)
+    width = cols + 2
+    size = padded.size
+    blocked = memoryview(padded.reshape(-1))
+    g_score = np.full(size, np.inf)
+    parent = np.full(size, -1, dtype=index_dtype(size))
+    closed = np.zeros(size, dtype=np.uint8)
+    g_view = memoryview(g_score)
+    parent_view = memoryview(parent)
+    closed_view = memoryview(closed)
+    estimate = octile_heuristic if diagonal else heuristic
+
+    start_cell = (start[0] + 1) * width + start[1] + 1
+    goal_cell = (goal[0] + 1) * width + goal[1] + 1
+    # Straight jumps search the bytes of the grid (and of its transpose for columns) at
+    # C speed. Every step of a 4-connected vertical scan probes both horizontal directions,
+    # and scanning those rows cell by cell made one vertical jump O(rows * cols).
+    height = len(padded)
+    row_data = padded.tobytes()
+    column_data = padded.T.tobytes() if diagonal else None
+    goal_row, goal_col = divmod(goal_cell, width)
+    goal_in_columns = goal_col * height + goal_row
+
+    def jump_straight(cell, step, side):
+        # Scan along a row (side = width) or a column (side = 1); returns a jump point or -1
+        if side == width:
+            return jump_along_row(row_data, width, cell, step, goal_cell)
+        if diagonal:
+            # A column of the grid is a row of its transpose
+            row, col = divmod(cell, width)
+            found = jump_along_row(column_data, height, col * height + row, step // width, goal_in_columns)
+            return -1 if found == -1 else (found % height) * width + found // height
+        while True:
+            cell += step
+            if blocked[cell]:
+                return -1
+            if cell == goal_cell:
+                return cell
+            if (not blocked[cell - side] and blocked[cell - side - step]) or \
+               (not blocked[cell + side] and blocked[cell + side - step]):
+                return cell
+            # 4-connected paths turn here, so a horizontal jump point makes this one too
+            if jump_along_row(row_data, width, cell, 1, goal_cell) != -1 or \
+               jump_along_row(row_data, width, cell, -1, goal_cell) != -1:
+                return cell
+
+    def jump_diagonal(cell, step_row, step_col):
+        # Scan along a diagonal; every cell also probes its two straight directions
+        vertical = step_row * width
+        step = vertical + step_col
+        while True:
+            if blocked[cell + vertical] or blocked[cell + step_col]:
+                return -1  # No corner cutting
+            cell += step
+            if blocked[cell]:
+                return -1
+            if cell == goal_cell:
+                return cell
+            if jump_straight(cell, vertical, 1) != -1 or jump_straight(cell, step_col, width) != -1:
+                return cell
+
+    def successors(row, col, parent_cell):
+        # Directions worth jumping in, pruned by the direction we arrived from
+        if parent_cell == -1:
+            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+            if diagonal:
+                directions += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+            return directions
+
+        parent_row, parent_col = divmod(parent_cell, width)
+        step_row = (row > parent_row) - (row < parent_row)
+        step_col = (col > parent_col) - (col < parent_col)
+        if step_row and step_col:
+            return [(step_row, 0), (0, step_col), (step_row, step_col)]
+        if diagonal:
+            if step_col:
+                return [(0, step_col), (1, 0), (-1, 0), (1, step_col), (-1, step_col)]
+            return [(step_row, 0), (0, 1), (0, -1), (step_row, 1), (step_row, -1)]
+        if step_col:
+            return [(0, step_col), (1, 0), (-1, 0)]
+        return [(step_row, 0), (0, 1), (0, -1)]
+
+    g_view[start_cell] = 0.0
+    goal_point = divmod(goal_cell, width)
+    h = estimate(start, goal)
+    open_list = [(h, h, start_cell)]
+    expanded = 0
+    pushed = 1
+
+    while open_list:
+        _, _, cell = heapq.heappop(open_list)
+        if closed_view[cell]:
+            continue  # Stale entry
+        if cell == goal_cell:
+            break
+        closed_view[cell] = 1
+        expanded += 1
+
+        point = divmod(cell, width)
+        g = g_view[cell]
+        for step_row, step_col in successors(point[0], point[1], parent_view[cell]):
+            if step_row and step_col:
+                jump_cell = jump_diagonal(cell, step_row, step_col)
+            elif step_col:
+                jump_cell = jump_straight(cell, step_col, width)
+            else:
+                jump_cell = jump_straight(cell, step_row * width, 1)
+            if jump_cell == -1 or closed_view[jump_cell]:
+                continue
+
+            jump_point = divmod(jump_cell, width)
+            next_g = g + estimate(point, jump_point)  # Jumps are straight lines, so this is exact
+            if next_g >= g_view[jump_cell]:
+                continue
+
+            g_view[jump_cell] = next_g
+            parent_view[jump_cell] = cell
+            jump_h = estimate(jump_point, goal_point)
+            heapq.heappush(open_list, (next_g + jump_h, jump_h, jump_cell))
+            pushed += 1
+    else:
+        cell = -1
+
+    if stats is not None:
+        stats["expanded"] = expanded
+        stats["pushed"] = pushed
+
+    if cell == -1:
+        return []  # No path found
+    jump_points = [(row - 1, col - 1) for row, col in trace_path(parent_view, cell, width)]
+    return expand_jump_path(jump_points)
+
+def bidirectional_a_star(grid, start, goal, stats=None, heuristic_fn=heuristic):
+    """
+    Bidirectional A* with the Manhattan heuristic on a 4-connected grid.
+    
+    Parameters:
+    grid (numpy.ndarray or list of list of int): 2D grid where 0 is walkable and 1 is an obstacle.
+    start (tuple): Starting coordinates (x, y).
+    goal (tuple): Goal coordinates (x, y).
+    stats (dict): Optional dict that receives the "expanded" and "pushed" counters.
+    heuristic_fn (callable): Symmetric lower bound h(a, b), Manhattan distance by default.
+    
+    Returns:
+    list of tuple: Shortest path from start to goal, or an empty list if no path is found
+                  or the start or goal cell is an obstacle.
+    """
+    cells = as_grid_array(grid)
+    rows, cols = cells.shape
+    if not (0 <= start[0] < rows and 0 <= start[1] < cols):
+        return []
+    if not (0 <= goal[0] < rows and 0 <= goal[1] < cols):
+        return []
+
+    if cells[start[0], start[1]] or cells[goal[0], goal[1]]:
+        return []  # The backward search would otherwise start inside an obstacle
+
+    size = rows * cols
+    dtype = index_dtype(size)
+    blocked = memoryview(cells.reshape(-1))
+    start_cell = start[0] * cols + start[1]
+    goal_cell = goal[0] * cols + goal[1]
+
+    # Index 0 is the forward search from start, index 1 the backward search from goal
+    g_scores = [np.full(size, np.inf), np.full(size, np.inf)]
+    parents = [np.full(size, -1, dtype=dtype), np.full(size, -1, dtype=dtype)]
+    g_views = [memoryview(g_scores[0]), memoryview(g_scores[1])]
+    parent_views = [memoryview(parents[0]), memoryview(parents[1])]
+    targets = [tuple(goal), tuple(start)]
+
+    h = heuristic_fn(start, goal)
+    g_views[0][start_cell] = 0
+    g_views[1][goal_cell] = 0
+    open_lists = [[(h, h, 0, start_cell)], [(h, h, 0, goal_cell)]] if h != math.inf else [[], []]
+    expanded = 0
+    pushed = len(open_lists[0]) + len(open_lists[1])
+
+    best_cost = 0 if start_cell == goal_cell else math.inf
+    meeting_cell = start_cell if start_cell == goal_cell else -1
+
+    while open_lists[0] and open_lists[1]:
+        # Any path not found yet runs through both frontiers, so it costs at least
+        # the larger of the two smallest f values
+        if best_cost <= max(open_lists[0][0][0], open_lists[1][0][0]):
+            break
+
+        side = 0 if len(open_lists[0]) <= len(open_lists[1]) else 1
+        open_list = open_lists[side]
+        g_view = g_views[side]
+        parent_view = parent_views[side]
+        other_g_view = g_views[1 - side]
+        target = targets[side]
+
+        f, h, g, cell = heapq.heappop(open_list)
+        if g > g_view[cell]:
+            continue  # Stale entry
+        expanded += 1
+
+        row, col = divmod(cell, cols)
+        next_g = g + 1
+        for neighbor_row, neighbor_col, neighbor in (
+            (row, col + 1, cell + 1),
+            (row + 1, col, cell + cols),
+            (row, col - 1, cell - 1),
+            (row - 1, col, cell - cols),
+        ):
+            if not (0 <= neighbor_row < rows and 0 <= neighbor_col < cols):
+                continue  # Skip out of bounds positions
+            if blocked[neighbor]:
+                continue  # Skip obstacles
+
+            if g_view[neighbor] <= next_g:
+                continue  # Already reached at least as cheaply from this side
+
+            neighbor_h = heuristic_fn((neighbor_row, neighbor_col), target)
+            if neighbor_h == math.inf:
+                continue  # The other end cannot be reached from this cell
+
+            g_view[neighbor] = next_g
+            parent_view[neighbor] = cell
+
+            other_g = other_g_view[neighbor]
+            if next_g + other_g < best_cost:
+                best_cost = next_g + other_g  # The frontiers meet here
+                meeting_cell = neighbor
+
+            heapq.heappush(open_list, (next_g + neighbor_h, neighbor_h, next_g, neighbor))
+            pushed += 1
+
+    if stats is not None:
+        stats["expanded"] = expanded
+        stats["pushed"] = pushed
+
+    if meeting_cell == -1:
+        return []  # No path found
+
+    # Forward half ends at the meeting cell, the backward half walks on to the goal
+    path = trace_path(parent_views[0], meeting_cell, cols)
+    cell = parent_views[1][meeting_cell]
+    while cell != -1:
+        path.append(divmod(cell, cols))
+        cell = parent_views[1][cell]
+    return path
+
+def anytime_a_star(grid, start, goal, weight=3.0, weight_step=0.5, time_budget=None, node_budget=None,
+                   stats=None, heuristic_fn=None):
+    """
+    Anytime Repairing A* (ARA*): yields improving paths with a suboptimality bound.
+    
+    Parameters:
+    grid (numpy.ndarray or list of list of int): 2D grid where 0 is walkable and 1 is an obstacle.
+    start (tuple): Starting coordinates (x, y).
+    goal (tuple): Goal coordinates (x, y).
+    weight (float): Initial heuristic inflation w >= 1.
+    weight_step (float): Amount w is lowered after every round.
+    time_budget (float): Optional seconds, counted from the first next(), after which the search stops.
+    node_budget (int): Optional maximum number of expansions over all rounds.
+    stats (dict): Optional dict that receives the "expanded" and "pushed" counters.
+    heuristic_fn (callable): Optional lower bound h(position, goal); None uses the Manhattan distance.
+    
+    Yields:
+    tuple: (path, bound) where path is a list of (x, y) tuples and cost(path) <= bound * optimal cost.
+    """
+    cells = as_grid_array(grid)
+    rows, cols = cells.shape
+    if not (0 <= start[0] < rows and 0 <= start[1] < cols):
+        return
+    if not (0 <= goal[0] < rows and 0 <= goal[1] < cols):
+        return
+    if weight < 1:
+        raise ValueError("weight must be at least 1")
+
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    estimate = heuristic if heuristic_fn is None else heuristic_fn
+    size = rows * cols
+    blocked = memoryview(cells.reshape(-1))
+    g_score = np.full(size, np.inf)
+    parent = np.full(size, -1, dtype=index_dtype(size))
+    closed = np.zeros(size, dtype=np.uint8)
+    g_view = memoryview(g_score)
+    parent_view = memoryview(parent)
+    closed_view = memoryview(closed)
+    h_cache = {}  # h of every cell seen, needed again when the open list is re-keyed
+
+    start_cell = start[0] * cols + start[1]
+    goal_cell = goal[0] * cols + goal[1]
+    g_view[start_cell] = 0
+    h_cache[start_cell] = estimate(start, goal)
+    if h_cache[start_cell] == math.inf:
+        return
+
+    open_cells = {start_cell}
+    incons = set()
+    closed_cells = []
+    counters = {"expanded": 0, "pushed": 1}
+    if stats is not None:
+        stats.update(counters)
+
+    def improve_path(eps, open_list):
+        # Expand until no open cell can beat the goal under the current inflation
+        while open_list:
+            f, _, g, cell = open_list[0]
+            if closed_view[cell] or g != g_view[cell]:
+                heapq.heappop(open_list)  # Stale entry
+                continue
+            if g_view[goal_cell] <= f:
+                return True
+            if node_budget is not None and counters["expanded"] >= node_budget:
+                return False
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+
+            heapq.heappop(open_list)
+            open_cells.discard(cell)
+            closed_view[cell] = 1
+            closed_cells.append(cell)
+            counters["expanded"] += 1
+
+            row, col = divmod(cell, cols)
+            next_g = g + 1
+            for neighbor_row, neighbor_col, neighbor in (
+                (row, col + 1, cell + 1),
+                (row + 1, col, cell + cols),
+                (row, col - 1, cell - 1),
+                (row - 1, col, cell - cols),
+            ):
+                if not (0 <= neighbor_row < rows and 0 <= neighbor_col < cols):
+                    continue
+                if blocked[neighbor] or g_view[neighbor] <= next_g:
+                    continue
+                neighbor_h = h_cache.get(neighbor)
+                if neighbor_h is None:
+                    neighbor_h = h_cache[neighbor] = estimate((neighbor_row, neighbor_col), goal)
+                if neighbor_h == math.inf:
+                    continue  # The goal cannot be reached from this cell
+
+                g_view[neighbor] = next_g
+                parent_view[neighbor] = cell
+                if closed_view[neighbor]:
+                    incons.add(neighbor)  # Re-expanded in the next round, not this one
+                else:
+                    open_cells.add(neighbor)
+                    heapq.heappush(open_list, (next_g + eps * neighbor_h, neighbor_h, next_g, neighbor))
+                    counters["pushed"] += 1
+        return True
+
+    eps = weight
+    best_cost = best_bound = math.inf
+    while True:
+        # Re-key OPEN (plus INCONS) for the new inflation and start with an empty CLOSED
+        open_cells |= incons
+        incons.clear()
+        for cell in closed_cells:
+            closed_view[cell] = 0
+        closed_cells.clear()
+        open_list = [(g_view[cell] + eps * h_cache[cell], h_cache[cell], g_view[cell], cell) for cell in open_cells]
+        heapq.heapify(open_list)
+
+        finished = improve_path(eps, open_list)
+        if stats is not None:
+            stats.update(counters)
+        if not finished:
+            return
+
+        cost = g_view[goal_cell]
+        if cost == math.inf:
+            return  # No path found
+        lower_bound = min((g_view[cell] + h_cache[cell] for cell in open_cells | incons), default=cost)
+        bound = max(1.0, min(eps, cost / lower_bound)) if lower_bound > 0 else 1.0
+        if cost < best_cost or bound < best_bound:
+            # Publish when the path got shorter or its guarantee got tighter
+            best_cost = cost
+            best_bound = bound
+            yield trace_path(parent_view, goal_cell, cols), bound
+        if bound == 1.0:
+            return
+        eps = max(1.0, eps - weight_step)
+
+def weighted_a_star(grid, start, goal, weight=1.5, stats=None, heuristic_fn=None):
+    """
+    Weighted A* (f = g + w * h): a path at most `weight` times longer than the shortest one.
+    
+    Parameters:
+    grid (numpy.ndarray or list of list of int): 2D grid where 0 is walkable and 1 is an obstacle.
+    start (tuple): Starting coordinates (x, y).
+    goal (tuple): Goal coordinates (x, y).
+    weight (float): Heuristic inflation w >= 1.
+    stats (dict): Optional dict that receives the "expanded" and "pushed" counters.
+    heuristic_fn (callable): Optional lower bound h(position, goal); None uses the Manhattan distance.
+    
+    Returns:
+    list of tuple: Path from start to goal, or an empty list if no path is found.
+    """
+    for path, _ in anytime_a_star(grid, start, goal, weight=weight, stats=stats, heuristic_fn=heuristic_fn):
+        return path
+    return []
+
+def grid_distances(cells, source_cell):
+    """
+    Breadth-first distances from one cell to every cell of a 4-connected grid.
+    
+    Parameters:
+    cells (numpy.ndarray): 2D uint8 obstacle array as returned by as_grid_array.
+    source_cell (int): Flat id of the source cell.
+    
+    Returns:
+    numpy.ndarray: Flat int32 array of step counts, -1 for unreachable cells.
+    """
+    rows, cols = cells.shape
+    blocked = memoryview(cells.reshape(-1))
+    distances = np.full(rows * cols, -1, dtype=np.int32)
+    distance_view = memoryview(distances)
+    distance_view[source_cell] = 0
+
+    frontier = [source_cell]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for cell in frontier:
+            col = cell % cols
+            for neighbor, inside in (
+                (cell + 1, col + 1 < cols),
+                (cell + cols, cell + cols < rows * cols),
+                (cell - 1, col > 0),
+                (cell - cols, cell >= cols),
+            ):
+                if inside and not blocked[neighbor] and distance_view[neighbor] == -1:
+                    distance_view[neighbor] = depth
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return distances
+
+class LandmarkHeuristic:
+    """
+    ALT heuristic: precomputed landmark distances for one static 4-connected grid.
+    
+    Attributes:
+    shape (tuple): Grid shape (rows, cols).
+    landmarks (numpy.ndarray): Landmark coordinates, one (row, col) per line.
+    distances (numpy.ndarray): int32 table with one row per landmark and one column
+                               per flat cell id, -1 where the cell is unreachable.
+    """
+
+    def __init__(self, shape, landmarks, distances):
+        self.shape = tuple(int(n) for n in shape)
+        self.landmarks = np.asarray(landmarks, dtype=np.int64).reshape(-1, 2)
+        self.distances = np.ascontiguousarray(distances, dtype=np.int32).reshape(
+            len(self.landmarks), self.shape[0] * self.shape[1])
+        # memoryviews give fast scalar access during the search
+        self.rows = [memoryview(table) for table in self.distances]
+        self.goal_columns = {}  # Landmark distances of recent goal cells, by cell id
+
+    @classmethod
+    def build(cls, grid, num_landmarks=8):
+        """
+        Pick landmarks by farthest-point selection and compute their distance tables.
+        
+        The first landmark is the cell farthest from the first walkable cell; each next
+        landmark is the cell whose distance to its nearest landmark is largest.
+        
+        Parameters:
+        grid (numpy.ndarray or list of list of int): 2D grid where 0 is walkable and 1 is an obstacle.
+        num_landmarks (int): Number of landmarks to place.
+        
+        Returns:
+        LandmarkHeuristic: The precomputed heuristic.
+        """
+        cells = as_grid_array(grid)
+        rows, cols = cells.shape
+        walkable = np.flatnonzero(cells.reshape(-1) == 0)
+        if walkable.size == 0 or num_landmarks <= 0:
+            return cls(cells.shape, np.empty((0, 2)), np.empty((0, rows * cols)))
+
+        seed_distances = grid_distances(cells, int(walkable[0]))
+        landmark_cells = [int(np.argmax(seed_distances))]
+        tables = [grid_distances(cells, landmark_cells[0])]
+        nearest = tables[0].astype(np.int64)
+
+        while len(landmark_cells) < num_landmarks:
+            candidate = int(np.argmax(nearest))
+            if nearest[candidate] <= 0:
+                break  # Every reachable cell is already a landmark
+            landmark_cells.append(candidate)
+            tables.append(grid_distances(cells, candidate))
+            np.minimum(nearest, tables[-1], out=nearest)
+
+        landmarks = [divmod(cell, cols) for cell in landmark_cells]
+        return cls(cells.shape, landmarks, np.stack(tables))
+
+    def save(self, path):
+        """Write the landmarks and distance tables to a .npz file."""
+        np.savez(path, shape=np.array(self.shape), landmarks=self.landmarks, distances=self.distances)
+
+    @classmethod
+    def load(cls, path):
+        """Read a heuristic written by save()."""
+        with np.load(path) as data:
+            return cls(data["shape"], data["landmarks"], data["distances"])
+
+    def __call__(self, a, b):
+        """
+        Lower bound on the path length between two cells.
+        
+        Parameters:
+        a (tuple): Current cell (row, col).
+        b (tuple): Goal cell (row, col).
+        
+        Returns:
+        int or float: max(Manhattan, |d(L, a) - d(L, b)| over landmarks L), or math.inf
+                      when a landmark proves the two cells are in different components.
+        """
+        cols = self.shape[1]
+        goal_cell = b[0] * cols + b[1]
+        goal_distances = self.goal_columns.get(goal_cell)
+        if goal_distances is None:
+            # The goal column is looked up once per goal instead of once per cell; several
+            # are kept because bidirectional_a_star alternates between two targets
+            if len(self.goal_columns) >= 16:
+                self.goal_columns.clear()
+            goal_distances = [row[goal_cell] for row in self.rows]
+            self.goal_columns[goal_cell] = goal_distances
+
+        cell = a[0] * cols + a[1]
+        bound = abs(a[0] - b[0]) + abs(a[1] - b[1])
+        for row, goal_distance in zip(self.rows, goal_distances):
+            distance = row[cell]
+            if distance == -1 or goal_distance == -1:
+                if distance != goal_distance:
+                    return math.inf  # One of them is reachable from this landmark, the other is not
+                continue
+            if distance - goal_distance > bound:
+                bound = distance - goal_distance
+            elif goal_distance - distance > bound:
+                bound = goal_distance - distance
+        return bound
+
+class HierarchicalGrid:
+    """
+    HPA* abstraction over a 4-connected grid.
+    
+    Attributes:
+    cells (numpy.ndarray): uint8 obstacle grid, updated by set_cell.
+    cluster_size (int): Side length of a cluster in cells.
+    entrances (dict): Border (cluster, cluster to the right or below) -> list of
+                      (cell, cell) transitions, cells given as flat ids.
+    inter_edges (dict): Cell -> set of cells across a border (cost 1).
+    intra_edges (dict): Cluster -> {cell: {cell: cost}} inside that cluster.
+    """
+
+    def __init__(self, grid, cluster_size=16, long_entrance=6):
+        """
+        Parameters:
+        grid (numpy.ndarray or list of list of int): 2D grid where 0 is walkable and 1 is an obstacle.
+        cluster_size (int): Side length of a cluster in cells.
+        long_entrance (int): Runs at least this long get a transition at each end instead of one in the middle.
+        """
+        self.cells = as_grid_array(grid).copy()
+        self.rows, self.cols = self.cells.shape
+        self.cluster_size = cluster_size
+        self.long_entrance = long_entrance
+        self.cluster_rows = -(-self.rows // cluster_size)
+        self.cluster_cols = -(-self.cols // cluster_size)
+        self.entrances = {}
+        self.inter_edges = {}
+        self.intra_edges = {}
+
+        for cluster_row in range(self.cluster_rows):
+            for cluster_col in range(self.cluster_cols):
+                if cluster_col + 1 < self.cluster_cols:
+                    self.build_border(((cluster_row, cluster_col), (cluster_row, cluster_col + 1)))
+                if cluster_row + 1 < self.cluster_rows:
+                    self.build_border(((cluster_row, cluster_col), (cluster_row + 1, cluster_col)))
+        for cluster_row in range(self.cluster_rows):
+            for cluster_col in range(self.cluster_cols):
+                self.build_cluster((cluster_row, cluster_col))
+
+    def cluster_of(self, cell):
+        """Cluster (cluster_row, cluster_col) that holds a flat cell id."""
+        row, col = divmod(cell, self.cols)
+        return row // self.cluster_size, col // self.cluster_size
+
+    def cluster_bounds(self, cluster):
+        """Row and column ranges (row0, row1, col0, col1) covered by a cluster."""
+        row0 = cluster[0] * self.cluster_size
+        col0 = cluster[1] * self.cluster_size
+        return row0, min(row0 + self.cluster_size, self.rows), col0, min(col0 + self.cluster_size, self.cols)
+
+    def cluster_borders(self, cluster):
+        """The up to four borders a cluster shares with its neighbors."""
+        cluster_row, cluster_col = cluster
+        borders = []
+        if cluster_col + 1 < self.cluster_cols:
+            borders.append((cluster, (cluster_row, cluster_col + 1)))
+        if cluster_row + 1 < self.cluster_rows:
+            borders.append((cluster, (cluster_row + 1, cluster_col)))
+        if cluster_col > 0:
+            borders.append(((cluster_row, cluster_col - 1), cluster))
+        if cluster_row > 0:
+            borders.append(((cluster_row - 1, cluster_col), cluster))
+        return borders
+
+    def cluster_nodes(self, cluster):
+        """Abstract nodes (flat cell ids) that lie inside a cluster."""
+        nodes = set()
+        for border in self.cluster_borders(cluster):
+            side = 0 if border[0] == cluster else 1
+            for transition in self.entrances.get(border, ()):
+                nodes.add(transition[side])
+        return nodes
+
+    def build_border(self, border):
+        """(Re)compute the entrances on one border and their inter-cluster edges."""
+        for cell_a, cell_b in self.entrances.pop(border, ()):
+            self.inter_edges[cell_a].discard(cell_b)
+            self.inter_edges[cell_b].discard(cell_a)
+
+        first, second = border
+        row0, row1, col0, col1 = self.cluster_bounds(first)
+        if second[1] > first[1]:
+            # Vertical border: column col1 - 1 on the left, col1 on the right
+            pairs = [(row * self.cols + col1 - 1, row * self.cols + col1) for row in range(row0, row1)]
+        else:
+            # Horizontal border: row row1 - 1 above, row1 below
+            pairs = [((row1 - 1) * self.cols + col, row1 * self.cols + col) for col in range(col0, col1)]
+
+        blocked = self.cells.reshape(-1)
+        transitions = []
+        run = []
+        for pair in pairs + [None]:
+            if pair is not None and not blocked[pair[0]] and not blocked[pair[1]]:
+                run.append(pair)
+                continue
+            if len(run) >= self.long_entrance:
+                transitions += [run[0], run[-1]]
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+
+        self.entrances[border] = transitions
+        for cell_a, cell_b in transitions:
+            self.inter_edges.setdefault(cell_a, set()).add(cell_b)
+            self.inter_edges.setdefault(cell_b, set()).add(cell_a)
+
+    def connect(self, cluster, cell, nodes):
+        """Costs from `cell` to each of `nodes` without leaving the cluster."""
+        row0, row1, col0, col1 = self.cluster_bounds(cluster)
+        sub = np.ascontiguousarray(self.cells[row0:row1, col0:col1])
+        row, col = divmod(cell, self.cols)
+        distances = grid_distances(sub, (row - row0) * (col1 - col0) + col - col0)
+        costs = {}
+        for node in nodes:
+            row, col = divmod(node, self.cols)
+            distance = int(distances[(row - row0) * (col1 - col0) + col - col0])
+            if distance > 0:
+                costs[node] = distance
+        return costs
+
+    def build_cluster(self, cluster):
+        """(Re)compute the node-to-node costs inside one cluster."""
+        nodes = self.cluster_nodes(cluster)
+        self.intra_edges[cluster] = {node: self.connect(cluster, node, nodes) for node in nodes}
+
+    def set_cell(self, position, value):
+        """
+        Change one cell and rebuild only the parts of the abstraction it affects.
+        
+        Parameters:
+        position (tuple): Cell coordinates (x, y).
+        value (int): 0 for walkable, 1 for obstacle.
+        """
+        row, col = position
+        self.cells[row, col] = 1 if value == 1 else 0
+        cell = row * self.cols + col
+        cluster = self.cluster_of(cell)
+        row0, row1, col0, col1 = self.cluster_bounds(cluster)
+
+        changed = {cluster}
+        for border in self.cluster_borders(cluster):
+            first, second = border
+            other = second if first == cluster else first
+            on_border = (
+                (other[1] > cluster[1] and col == col1 - 1) or (other[1] < cluster[1] and col == col0) or
+                (other[0] > cluster[0] and row == row1 - 1) or (other[0] < cluster[0] and row == row0)
+            )
+            if on_border:
+                self.build_border(border)
+                changed.add(other)
+        for affected in changed:
+            self.build_cluster(affected)
+
+    def find_path(self, start, goal):
+        """
+        Find a path by searching the abstract graph and refining the chosen segments.
+        
+        Parameters:
+        start (tuple): Starting coordinates (x, y).
+        goal (tuple): Goal coordinates (x, y).
+        
+        Returns:
+        list of tuple: Path from start to goal, or an empty list if no path is found.
+        """
+        if not (0 <= start[0] < self.rows and 0 <= start[1] < self.cols):
+            return []
+        if not (0 <= goal[0] < self.rows and 0 <= goal[1] < self.cols):
+            return []
+        start_cell = start[0] * self.cols + start[1]
+        goal_cell = goal[0] * self.cols + goal[1]
+        if self.cells[start[0], start[1]] or self.cells[goal[0], goal[1]]:
+            return []
+        if start_cell == goal_cell:
+            return [tuple(start)]
+
+        # Temporary edges from start and into goal, on top of the prebuilt graph
+        start_cluster = self.cluster_of(start_cell)
+        goal_cluster = self.cluster_of(goal_cell)
+        start_targets = self.cluster_nodes(start_cluster)
+        if start_cluster == goal_cluster:
+            start_targets.add(goal_cell)
+        start_edges = self.connect(start_cluster, start_cell, start_targets)
+        goal_edges = self.connect(goal_cluster, goal_cell, self.cluster_nodes(goal_cluster))
+
+        def neighbors(cell):
+            edges = [(other, 1) for other in self.inter_edges.get(cell, ())]
+            if cell == start_cell:
+                edges += start_edges.items()
+            else:
+                edges += self.intra_edges[self.cluster_of(cell)].get(cell, {}).items()
+            if cell in goal_edges:
+                edges.append((goal_cell, goal_edges[cell]))
+            return edges
+
+        # A* over the abstract graph
+        g_score = {start_cell: 0}
+        parent = {start_cell: -1}
+        h = heuristic(start, goal)
+        open_list = [(h, h, start_cell)]
+        while open_list:
+            f, h, cell = heapq.heappop(open_list)
+            g = f - h
+            if g > g_score[cell]:
+                continue  # Stale entry
+            if cell == goal_cell:
+                break
+            for neighbor, cost in neighbors(cell):
+                next_g = g + cost
+                if next_g < g_score.get(neighbor, math.inf):
+                    g_score[neighbor] = next_g
+                    parent[neighbor] = cell
+                    h = heuristic(divmod(neighbor, self.cols), goal)
+                    heapq.heappush(open_list, (next_g + h, h, neighbor))
+        else:
+            return []  # No path found
+
+        abstract_path = []
+        while cell != -1:
+            abstract_path.append(cell)
+            cell = parent[cell]
+        abstract_path.reverse()
+
+        # Refine: border crossings are single steps, segments inside a cluster are searched locally
+        path = [tuple(start)]
+        for cell, next_cell in zip(abstract_path, abstract_path[1:]):
+            cluster = self.cluster_of(cell)
+            if self.cluster_of(next_cell) != cluster:
+                path.append(divmod(next_cell, self.cols))
+                continue
+            row0, row1, col0, col1 = self.cluster_bounds(cluster)
+            local_start = divmod(cell, self.cols)
+            local_goal = divmod(next_cell, self.cols)
+            segment = a_star_array(self.cells[row0:row1, col0:col1],
+                                   (local_start[0] - row0, local_start[1] - col0),
+                                   (local_goal[0] - row0, local_goal[1] - col0))
+            path += [(row + row0, col + col0) for row, col in segment[1:]]
+        return path
+
+class DStarLite:
+    """
+    D* Lite incremental planner for a 4-connected grid that changes over time.
+    
+    Attributes:
+    cells (numpy.ndarray): uint8 obstacle grid, updated by update_cells.
+    start (tuple): Current start cell (row, col).
+    goal (tuple): Goal cell (row, col).
+    """
+
+    def __init__(self, grid, start, goal):
+        """
+        Parameters:
+        grid (numpy.ndarray or list of list of int): 2D grid where 0 is walkable and 1 is an obstacle.
+        start (tuple): Starting coordinates (x, y).
+        goal (tuple): Goal coordinates (x, y).
+        """
+        self.cells = as_grid_array(grid).copy()
+        self.rows, self.cols = self.cells.shape
+        size = self.rows * self.cols
+        self.blocked = memoryview(self.cells.reshape(-1))
+        self.g_score = np.full(size, np.inf)
+        self.rhs = np.full(size, np.inf)
+        self.g_view = memoryview(self.g_score)
+        self.rhs_view = memoryview(self.rhs)
+
+        self.start = tuple(start)
+        self.goal = tuple(goal)
+        self.start_cell = start[0] * self.cols + start[1]
+        self.goal_cell = goal[0] * self.cols + goal[1]
+        self.last = self.start
+        self.km = 0
+
+        # Open list with lazy deletion: `queued` holds the live key of every cell in it
+        self.open_list = []
+        self.queued = {}
+        self.rhs_view[self.goal_cell] = 0
+        self.push(self.goal_cell)
+
+    def key(self, cell):
+        """Priority [min(g, rhs) + h(start, cell) + km, min(g, rhs)] of a cell."""
+        best = min(self.g_view[cell], self.rhs_view[cell])
+        return best + heuristic(self.start, divmod(cell, self.cols)) + self.km, best
+
+    def push(self, cell):
+        key = self.key(cell)
+        self.queued[cell] = key
+        heapq.heappush(self.open_list, (key[0], key[1], cell))
+
+    def top(self):
+        """Live (key, cell) at the top of the open list, or (None, -1) when it is empty."""
+        while self.open_list:
+            k1, k2, cell = self.open_list[0]
+            if self.queued.get(cell) == (k1, k2):
+                return (k1, k2), cell
+            heapq.heappop(self.open_list)  # Stale entry
+        return None, -1
+
+    def neighbors(self, cell):
+        """In-bounds 4-connected neighbors of a cell, walkable or not."""
+        row, col = divmod(cell, self.cols)
+        result = []
+        if col + 1 < self.cols:
+            result.append(cell + 1)
+        if row + 1 < self.rows:
+            result.append(cell + self.cols)
+        if col > 0:
+            result.append(cell - 1)
+        if row > 0:
+            result.append(cell - self.cols)
+        return result
+
+    def cost(self, a, b):
+        """Cost of the move between two adjacent cells, infinite if either is an obstacle."""
+        return math.inf if self.blocked[a] or self.blocked[b] else 1
+
+    def best_rhs(self, cell):
+        """One-step lookahead: min over neighbors of cost + g."""
+        best = math.inf
+        for neighbor in self.neighbors(cell):
+            value = self.cost(cell, neighbor) + self.g_view[neighbor]
+            if value < best:
+                best = value
+        return best
+
+    def update_vertex(self, cell):
+        if self.g_view[cell] != self.rhs_view[cell]:
+            self.push(cell)  # Insert or refresh its key
+        else:
+            self.queued.pop(cell, None)
+
+    def compute_shortest_path(self):
+        """Expand inconsistent cells until the start is consistent; returns the expansion count."""
+        expanded = 0
+        g_view = self.g_view
+        rhs_view = self.rhs_view
+        while True:
+            top_key, cell = self.top()
+            if cell == -1:
+                break
+            start_key = self.key(self.start_cell)
+            if top_key >= start_key and rhs_view[self.start_cell] <= g_view[self.start_cell]:
+                break
+            expanded += 1
+
+            new_key = self.key(cell)
+            if top_key < new_key:
+                self.push(cell)  # Key grew after a km change, requeue it
+            elif g_view[cell] > rhs_view[cell]:
+                # Overconsistent: lower g and propagate to the neighbors
+                g_view[cell] = rhs_view[cell]
+                del self.queued[cell]
+                for neighbor in self.neighbors(cell):
+                    if neighbor != self.goal_cell:
+                        value = self.cost(neighbor, cell) + g_view[cell]
+                        if value < rhs_view[neighbor]:
+                            rhs_view[neighbor] = value
+                            self.update_vertex(neighbor)
+            else:
+                # Underconsistent: raise g to infinity and repair the cells that relied on it
+                old_g = g_view[cell]
+                g_view[cell] = math.inf
+                for neighbor in self.neighbors(cell) + [cell]:
+                    if neighbor != self.goal_cell and \
+                       (neighbor == cell or rhs_view[neighbor] == self.cost(neighbor, cell) + old_g):
+                        rhs_view[neighbor] = self.best_rhs(neighbor)
+                    self.update_vertex(neighbor)
+        return expanded
+
+    def path(self):
+        """Follow the cheapest neighbors from start to goal, or [] if the goal is unreachable."""
+        cell = self.start_cell
+        if self.rhs_view[cell] == math.inf:
+            return []  # rhs, not g: the search may stop with the start still overconsistent
+        path = [divmod(cell, self.cols)]
+        for _ in range(self.rows * self.cols):
+            if cell == self.goal_cell:
+                return path
+            cell = min(self.neighbors(cell), key=lambda neighbor: self.cost(cell, neighbor) + self.g_view[neighbor])
+            path.append(divmod(cell, self.cols))
+        return []  # Should not happen with consistent g values
+
+    def plan(self, stats=None):
+        """
+        Bring the search up to date and return the current shortest path.
+        
+        Parameters:
+        stats (dict): Optional dict that receives the "expanded" counter of this repair.
+        
+        Returns:
+        list of tuple: Shortest path from the current start to the goal, or an empty list.
+        """
+        expanded = self.compute_shortest_path()
+        if stats is not None:
+            stats["expanded"] = expanded
+        return self.path()
+
+    def move_to(self, position):
+        """Advance the start cell (the robot moved); earlier queue keys stay valid through km."""
+        self.km += heuristic(self.last, position)
+        self.last = tuple(position)
+        self.start = tuple(position)
+        self.start_cell = position[0] * self.cols + position[1]
+
+    def update_cells(self, changes, stats=None):
+        """
+        Apply a batch of cell changes and repair the path.
+        
+        Parameters:
+        changes (iterable): ((row, col), value) pairs, value 0 for walkable and 1 for obstacle.
+        stats (dict): Optional dict that receives the "expanded" counter of this repair.
+        
+        Returns:
+        list of tuple: Shortest path from the current start to the goal, or an empty list.
+        """
+        touched = set()
+        for (row, col), value in changes:
+            value = 1 if value == 1 else 0
+            cell = row * self.cols + col
+            if self.blocked[cell] == value:
+                continue
+            self.blocked[cell] = value
+            touched.add(cell)
+            touched.update(self.neighbors(cell))
+
+        # Only edges around the changed cells moved, so only their rhs values can change
+        for cell in touched:
+            if cell != self.goal_cell:
+                self.rhs_view[cell] = self.best_rhs(cell)
+            self.update_vertex(cell)
+        return self.plan(stats)
+
+# Engines solve_batch can run in the worker processes
+BATCH_ENGINES = {
+    "array": a_star_array,
+    "jps": jump_point_search,
+    "bidirectional": bidirectional_a_star,
+}
+
+# Per worker process state, set by attach_batch_grid when the worker starts
+batch_memory = None
+batch_grid = None
+batch_engine = None
+
+def attach_batch_grid(name, shape, engine):
+    """Pool initializer: map the shared obstacle grid into this worker process."""
+    global batch_memory, batch_grid, batch_engine
+    batch_memory = shared_memory.SharedMemory(name=name)
+    batch_grid = np.ndarray(shape, dtype=np.uint8, buffer=batch_memory.buf)
+    batch_engine = BATCH_ENGINES[engine]
+
+def solve_batch_query(query):
+    """Pool task: solve one (start, goal) query on the shared grid."""
+    start, goal = query
+    return batch_engine(batch_grid, start, goal)
+
+def solve_batch(grid, queries, processes=None, engine="array", chunksize=None):
+    """
+    Solve many path queries on one grid across a pool of worker processes.
+    
+    Parameters:
+    grid (numpy.ndarray or list of list of int): 2D grid where 0 is walkable and 1 is an obstacle.
+    queries (list of tuple): (start, goal) coordinate pairs.
+    processes (int): Number of worker processes, os.cpu_count() by default; 1 runs in this process.
+    engine (str): "array", "jps" or "bidirectional".
+    chunksize (int): Queries handed to a worker at a time, chosen by the pool by default.
+    
+    Returns:
+    list of list of tuple: One path per query, in input order ([] where no path exists).
+    """
+    if engine not in BATCH_ENGINES:
+        raise ValueError(f"Unknown batch engine: {engine!r}")
+    cells = as_grid_array(grid)
+    queries = [(tuple(start), tuple(goal)) for start, goal in queries]
+    if processes == 1 or len(queries) <= 1:
+        return [BATCH_ENGINES[engine](cells, start, goal) for start, goal in queries]
+
+    memory = shared_memory.SharedMemory(create=True, size=max(cells.nbytes, 1))
+    shared = np.ndarray(cells.shape, dtype=np.uint8, buffer=memory.buf)
+    shared[:] = cells
+    try:
+        with multiprocessing.Pool(processes, initializer=attach_batch_grid,
+                                  initargs=(memory.name, cells.shape, engine)) as pool:
+            if chunksize is None:
+                chunksize = max(1, len(queries) // (4 * (processes or multiprocessing.cpu_count())))
+            return pool.map(solve_batch_query, queries, chunksize)
+    finally:
+        del shared  # The view must go before the block can be closed
+        memory.close()
+        memory.unlink()
+
 if __name__ == "__main__":
     # Example grid (0 = walkable, 1 = obstacle)
     grid = [
@@ -145,6 +1489,51 @@ if __name__ == "__main__":
     else:
         print("No path found.")
 
+    print("Finding the shortest path using the array engine...")
+    print(f"Shortest path found: {a_star(np.array(grid), start, goal, engine='array')}")
+
+    print("Finding the shortest path using Jump Point Search...")
+    print(f"Shortest path found: {a_star(grid, start, goal, engine='jps')}")
+    open_grid = np.zeros((2000, 2000), dtype=np.uint8)
+    for name, search in (("a_star_array", a_star_array), ("jump_point_search", jump_point_search)):
+        began = time.perf_counter()
+        search(open_grid, (0, 0), (1999, 1999))
+        print(f"{name} on an open 2000x2000 grid: {(time.perf_counter() - began) * 1000:.0f} ms")
+
+    print("Finding the shortest path using bidirectional A*...")
+    one_way, two_way = {}, {}
+    a_star_array(grid, start, goal, stats=one_way)
+    print(f"Shortest path found: {bidirectional_a_star(grid, start, goal, stats=two_way)}")
+    print(f"Nodes expanded: {two_way['expanded']} (single frontier: {one_way['expanded']})")
+    # A blocked goal has no path, whichever end the search starts from
+    corner = [[1, 0], [0, 0]]
+    assert all(a_star(corner, (1, 1), (0, 0), engine=engine) == []
+               for engine in ("node", "array", "jps", "bidirectional"))
+
+    print("Finding the shortest path using the landmark (ALT) heuristic...")
+    landmarks = LandmarkHeuristic.build(grid, num_landmarks=2)
+    alt_stats = {}
+    print(f"Shortest path found: {a_star_array(grid, start, goal, stats=alt_stats, heuristic_fn=landmarks)}")
+    print(f"Nodes expanded: {alt_stats['expanded']} (Manhattan: {one_way['expanded']})")
+
+    print("Finding a path using hierarchical pathfinding (HPA*)...")
+    hierarchy = HierarchicalGrid(grid, cluster_size=3)
+    print(f"Path found: {hierarchy.find_path(start, goal)}")
+
+    print("Replanning with D* Lite after blocking (4, 1)...")
+    planner = DStarLite(grid, start, goal)
+    planner.plan()
+    print(f"Shortest path found: {planner.update_cells([((4, 1), 1)])}")
+
+    print("Improving paths with anytime A* (ARA*)...")
+    for path, bound in anytime_a_star(grid, start, goal, weight=3.0, time_budget=0.002):
+        print(f"Path of length {len(path) - 1}, at most {bound:.2f} x optimal")
+
+    print("Solving a batch of queries over a process pool...")
+    queries = [(start, goal), (goal, start), ((0, 2), (4, 0))]
+    for (query_start, query_goal), path in zip(queries, solve_batch(grid, queries, processes=2)):
+        print(f"{query_start} -> {query_goal}: {path}")
+
 # EOF
 
 
@@ -35,46 +35,722 @@ Target is less than 24, searching left half.
 Checking middle element at index 6: 21
 Target 21 found at index 6.
 
+Tracing:
+binary_search itself is silent. Pass trace=print_trace (or any callback taking
+mid, arr[mid] and target) to see every probe as in the output above.
+
+Batch Search:
+binary_search_batch takes a sorted NumPy array and an array of queries and answers all of
+them in one vectorized call (numpy.searchsorted), either as exact matches (-1 when absent),
+as lower bounds (first index with arr[i] >= q) or as upper bounds (first index with arr[i] > q).
+
+Static Eytzinger Index:
+Classic halving jumps across the whole array, so on large key sets almost every probe is
+a cache miss. EytzingerIndex stores the sorted keys in breadth-first (heap) order of the
+implicit search tree: the root at position 1 and the children of position k at 2k and 2k+1.
+The first levels of the tree share a few cache lines, and the two children of a node sit
+next to each other. A lookup walks k = 2k + (key < query) down the tree, and
+benchmark_static_index compares it with binary_search and bisect.
+
+On-Disk Search:
+SortedRecordFile memory-maps a file of fixed-width records sorted by key (numpy.memmap)
+and binary-searches it in place, so nothing is loaded or copied and the operating system
+only pages in what the probes touch. A small sparse index keeps the key of every k-th
+record in memory: it narrows a lookup to one block of pages first, so only the last few
+probes touch the disk. range(low, high) returns the records with low <= key < high as a
+view into the mapped file.
+
+Galloping and Interpolation Search:
+exponential_search probes positions 0, 1, 3, 7, 15, ... (or the same distances back from the
+end with from_end=True) until it passes the target, then halves inside that last gap, so a
+target i places from the searched end costs about 2 log2(i) probes instead of log2(n).
+interpolation_search guesses the position from the key values, which takes about
+log2(log2(n)) probes on roughly uniform keys; whenever a guess fails to halve the range the
+next probe falls back to the midpoint, so it never needs more than about 2 log2(n) probes.
+choose_search samples a few keys once and returns interpolation_search when they lie close
+to a straight line, otherwise galloping from the end (near_end=True) or plain binary_search.
+
+Learned Index:
+LearnedIndex replaces the upper levels of the search with a model of the key -> position
+mapping. It covers the sorted keys with line segments (greedy "shrinking cone" fit) such
+that every key's predicted position is within max_error of its real one, so a lookup finds
+its segment among the few segment start keys and then binary-searches only the window of
+2 * max_error + 3 positions around the prediction. If the answer sits outside the window
+(possible for keys that are not in the array) the search simply widens to that side.
+benchmark_learned_index reports build time, memory and lookup latency next to binary_search.
+
+"""
+
 # Binary Search Algorithm
 # Astro Pema Software (c)
 # Oba Ozai Nov 2024
 
-def binary_search(arr, target):
+import bisect
+import functools
+import math
+import mmap
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+def print_trace(mid, value, target):
+    """Trace callback for binary_search that prints each probe and the half searched next."""
+    print(f"Checking middle element at index {mid}: {value}")
+    if value > target:
+        print(f"Target is less than {value}, searching left half.")
+    elif value < target:
+        print(f"Target is greater than {value}, searching right half.")
+
+def binary_search(arr, target, trace=None, left=0, right=None):
     """
     Perform binary search on a sorted list to find the target value.
     
     Parameters:
     arr (list): The sorted list to search in.
     target (int): The value to search for.
+    trace (callable): Optional callback trace(mid, arr[mid], target) called on every probe.
+    left (int): First index of the range to search.
+    right (int): Last index of the range to search, the end of the list by default.
 
     Returns:
     int: The index of the target value if found, otherwise -1.
     """
     # Define the initial left and right pointers
-    left, right = 0, len(arr) - 1
+    if right is None:
+        right = len(arr) - 1
 
     while left <= right:
         # Find the middle element
         mid = (left + right) // 2
-        print(f"Checking middle element at index {mid}: {arr[mid]}")
+        value = arr[mid]
+        if trace is not None:
+            trace(mid, value, target)
 
         # Check if the middle element is the target
-        if arr[mid] == target:
+        if value == target:
             return mid  # Target found, return the index
         
         # If target is less than the middle element, search in the left half
-        elif arr[mid] > target:
-            print(f"Target is less than {arr[mid]}, searching left half.")
+        elif value > target:
             right = mid - 1
 
         # If target is greater than the middle element, search in the right half
         else:
-            print(f"Target is greater than {arr[mid]}, searching right half.")
             left = mid + 1
 
     # Target not found
     return -1
 
+def exponential_search(arr, target, trace=None, from_end=False):
+    """
+    Galloping search: double the step until the target is passed, then binary search.
+    
+    Parameters:
+    arr (list): The sorted list to search in.
+    target (int): The value to search for.
+    trace (callable): Optional callback trace(mid, arr[mid], target) called on every probe.
+    from_end (bool): Gallop backwards from the last element (targets near the end).
+
+    Returns:
+    int: The index of the target value if found, otherwise -1.
+    """
+    last = len(arr) - 1
+    left, right = 0, last
+    offset = 0  # Distance of the next probe from the end we gallop from
+    while offset <= last:
+        mid = last - offset if from_end else offset
+        value = arr[mid]
+        if trace is not None:
+            trace(mid, value, target)
+
+        if value == target:
+            return mid
+        if (value > target) == from_end:
+            # Still short of the target: it lies beyond this probe
+            if from_end:
+                right = mid - 1
+            else:
+                left = mid + 1
+            offset = 2 * offset + 1
+        else:
+            # Passed the target: it lies in the gap since the previous probe
+            if from_end:
+                left = mid + 1
+            else:
+                right = mid - 1
+            break
+
+    return binary_search(arr, target, trace, left, right)
+
+def exact_value(value):
+    """Python int or float for a NumPy scalar, so arithmetic on large keys cannot overflow."""
+    return value.item() if isinstance(value, np.generic) else value
+
+def interpolation_search(arr, target, trace=None):
+    """
+    Interpolation search with a fallback to halving when a guess does not halve the range.
+    
+    Parameters:
+    arr (list): The sorted list of numbers to search in.
+    target (int or float): The value to search for.
+    trace (callable): Optional callback trace(mid, arr[mid], target) called on every probe.
+
+    Returns:
+    int: The index of the target value if found, otherwise -1.
+    """
+    left, right = 0, len(arr) - 1
+    if right < 0:
+        return -1
+
+    # Probe both ends first: the guesses interpolate between known values
+    for end in sorted({left, right}):
+        value = arr[end]
+        if trace is not None:
+            trace(end, value, target)
+        if value == target:
+            return end
+    target = exact_value(target)
+    left_value, right_value = exact_value(arr[left]), exact_value(arr[right])
+    if not left_value < target < right_value:
+        return -1
+
+    # Invariant: arr[left] < target < arr[right], the target can only be strictly between them
+    halve = False
+    while right - left > 1:
+        if halve:
+            mid = (left + right) // 2
+        else:
+            mid = left + int((target - left_value) * (right - left) / (right_value - left_value))
+            mid = min(max(mid, left + 1), right - 1)
+        value = arr[mid]
+        if trace is not None:
+            trace(mid, value, target)
+
+        width = right - left
+        if value == target:
+            return mid
+        if value < target:
+            left, left_value = mid, exact_value(value)
+        else:
+            right, right_value = mid, exact_value(value)
+        halve = right - left > width // 2
+
+    return -1
+
+def choose_search(arr, sample_size=32, tolerance=0.05, near_end=False):
+    """
+    Pick a search function for one sorted list by sampling its key distribution.
+    
+    Parameters:
+    arr (list): The sorted list the returned function will search.
+    sample_size (int): Number of evenly spaced keys to look at.
+    tolerance (float): Largest allowed gap between a sampled key and the straight line
+                       from the first to the last key, as a fraction of the key range.
+    near_end (bool): Targets are expected near the end (for example an append-only log).
+
+    Returns:
+    callable: A search(arr, target, trace=None) function.
+    """
+    n = len(arr)
+    if n >= sample_size >= 2:
+        first, last = exact_value(arr[0]), exact_value(arr[-1])
+        try:
+            span = last - first
+        except TypeError:
+            span = 0  # Keys that are not numbers cannot be interpolated
+        if span > 0:
+            positions = [i * (n - 1) // (sample_size - 1) for i in range(sample_size)]
+            worst = max(abs((exact_value(arr[p]) - first) - span * p / (n - 1)) for p in positions)
+            if worst <= tolerance * span:
+                return interpolation_search
+    if near_end:
+        return functools.partial(exponential_search, from_end=True)
+    return binary_search
+
+def binary_search_batch(arr, queries, mode="exact"):
+    """
+    Binary search for many queries at once on a sorted NumPy array.
+    
+    Parameters:
+    arr (numpy.ndarray): The sorted 1D array to search in.
+    queries (numpy.ndarray): The values to search for.
+    mode (str): "exact" for the index of an equal element (the first one) or -1,
+                "lower" for the first index i with arr[i] >= query,
+                "upper" for the first index i with arr[i] > query.
+
+    Returns:
+    numpy.ndarray: One int64 index per query, in the shape of `queries`.
+    """
+    arr = np.asarray(arr)
+    queries = np.asarray(queries)
+    if mode == "lower":
+        return np.searchsorted(arr, queries, side="left").astype(np.int64)
+    if mode == "upper":
+        return np.searchsorted(arr, queries, side="right").astype(np.int64)
+    if mode != "exact":
+        raise ValueError(f"Unknown search mode: {mode!r}")
+
+    flat = queries.reshape(-1)
+    indices = np.searchsorted(arr, flat, side="left").astype(np.int64)
+    found = indices < len(arr)
+    found[found] = arr[indices[found]] == flat[found]
+    indices[~found] = -1
+    return indices.reshape(queries.shape)
+
+def subtree_sizes(nodes, n):
+    """Number of nodes in the subtree of each Eytzinger position in `nodes` (tree of n nodes)."""
+    sizes = np.zeros(len(nodes), dtype=np.int64)
+    first = np.asarray(nodes, dtype=np.int64).copy()
+    width = 1
+    while True:
+        # The subtree fills positions first .. first + width - 1 on each lower level
+        active = first <= n
+        if not active.any():
+            return sizes
+        sizes += np.clip(n - first + 1, 0, width)
+        first *= 2
+        width *= 2
+
+def eytzinger_order(n):
+    """
+    Sorted index stored at each Eytzinger position 1..n.
+    
+    Computed one tree level at a time: a left child ranks just below its parent minus the
+    size of its own right subtree, and a right child just above it plus its left subtree.
+    
+    Parameters:
+    n (int): Number of keys.
+    
+    Returns:
+    numpy.ndarray: int64 array whose entry k - 1 is the sorted index held at position k.
+    """
+    rank = np.zeros(n + 1, dtype=np.int64)
+    if n == 0:
+        return rank[1:]
+    rank[1] = subtree_sizes([2], n)[0]
+
+    level = 1
+    while 2 * level <= n:
+        parents = np.arange(level, min(2 * level, n + 1), dtype=np.int64)
+        left = 2 * parents
+        right = left + 1
+        has_left = left <= n
+        has_right = right <= n
+        rank[left[has_left]] = rank[parents[has_left]] - 1 - subtree_sizes(2 * left[has_left] + 1, n)
+        rank[right[has_right]] = rank[parents[has_right]] + 1 + subtree_sizes(2 * right[has_right], n)
+        level *= 2
+    return rank[1:]
+
+class EytzingerIndex:
+    """
+    Read-only search index over sorted numeric keys in Eytzinger (BFS) layout.
+    
+    Attributes:
+    layout (numpy.ndarray): Keys in tree order; position 0 is unused so the root is at 1.
+    rank (numpy.ndarray): Sorted index of the key at each position; rank[0] = len(keys).
+    """
+
+    def __init__(self, keys):
+        """
+        Parameters:
+        keys (numpy.ndarray or list): Sorted numeric keys.
+        """
+        keys = np.ascontiguousarray(keys)
+        if keys.dtype.kind not in "iuf":
+            raise ValueError("EytzingerIndex needs numeric keys")
+        self.n = len(keys)
+        order = eytzinger_order(self.n)
+        self.layout = np.zeros(self.n + 1, dtype=keys.dtype)
+        self.layout[1:] = keys[order]
+        self.rank = np.empty(self.n + 1, dtype=np.int64)
+        self.rank[0] = self.n
+        self.rank[1:] = order
+        self.view = memoryview(self.layout)  # fast scalar access
+
+    def lower_bound(self, target):
+        """Sorted index of the first key >= target (len(keys) if there is none)."""
+        layout = self.view
+        n = self.n
+        k = 1
+        while k <= n:
+            k = 2 * k + (layout[k] < target)
+        # Undo the trailing right turns and the final left turn to get the answer's position
+        k >>= (~k & (k + 1)).bit_length()
+        return int(self.rank[k])
+
+    def search(self, target):
+        """Sorted index of a key equal to target, or -1 if it is absent."""
+        k = 1
+        n = self.n
+        layout = self.view
+        while k <= n:
+            value = layout[k]
+            if value == target:
+                return int(self.rank[k])
+            k = 2 * k + (value < target)
+        return -1
+
+    def lower_bound_positions(self, flat):
+        """Tree positions of the lower bounds of a 1D query array (0 where there is none)."""
+        k = np.ones(len(flat), dtype=np.int64)
+        if self.n:
+            # All queries walk down the tree together, one level per step
+            for _ in range(self.n.bit_length()):
+                inside = k <= self.n
+                step = self.layout[np.where(inside, k, 0)] < flat
+                k = np.where(inside, 2 * k + step, k)
+        lowest_zero = ~k & (k + 1)
+        return k // (2 * lowest_zero)
+
+    def lower_bound_batch(self, queries):
+        """
+        Lower bounds for many queries at once.
+        
+        Parameters:
+        queries (numpy.ndarray): Values to look up.
+        
+        Returns:
+        numpy.ndarray: int64 sorted index of the first key >= each query.
+        """
+        queries = np.asarray(queries)
+        positions = self.lower_bound_positions(queries.reshape(-1))
+        return self.rank[positions].reshape(queries.shape)
+
+    def search_batch(self, queries):
+        """Sorted index of a key equal to each query, or -1 where it is absent."""
+        queries = np.asarray(queries)
+        flat = queries.reshape(-1)
+        positions = self.lower_bound_positions(flat)
+        found = (positions > 0) & (self.layout[positions] == flat)
+        return np.where(found, self.rank[positions], -1).reshape(queries.shape)
+
+def benchmark_static_index(n=1_000_000, num_queries=20_000, seed=0):
+    """
+    Time lookups on the same sorted keys with binary_search, bisect and EytzingerIndex.
+    
+    Parameters:
+    n (int): Number of sorted keys.
+    num_queries (int): Number of lookups per method.
+    seed (int): Random seed for keys and queries.
+    
+    Returns:
+    dict: Seconds per lookup for each method.
+    """
+    rng = random.Random(seed)
+    keys = sorted(rng.sample(range(4 * n), n))
+    queries = [rng.randrange(4 * n) for _ in range(num_queries)]
+    key_array = np.array(keys, dtype=np.int64)
+    query_array = np.array(queries, dtype=np.int64)
+
+    start = time.perf_counter()
+    index = EytzingerIndex(key_array)
+    build_time = time.perf_counter() - start
+
+    timings = {}
+    for name, lookup in (
+        ("binary_search", lambda q: binary_search(keys, q)),
+        ("bisect", lambda q: bisect.bisect_left(keys, q)),
+        ("eytzinger", index.lower_bound),
+    ):
+        start = time.perf_counter()
+        for query in queries:
+            lookup(query)
+        timings[name] = (time.perf_counter() - start) / num_queries
+
+    start = time.perf_counter()
+    np.searchsorted(key_array, query_array)
+    timings["numpy.searchsorted (batch)"] = (time.perf_counter() - start) / num_queries
+    start = time.perf_counter()
+    index.lower_bound_batch(query_array)
+    timings["eytzinger (batch)"] = (time.perf_counter() - start) / num_queries
+
+    print(f"{n} keys, {num_queries} lookups, Eytzinger build {build_time * 1e3:.1f} ms")
+    for name, seconds in timings.items():
+        print(f"{name:>28}: {seconds * 1e9:8.0f} ns per lookup")
+    return timings
+
+class LearnedIndex:
+    """
+    Piecewise-linear learned index over sorted numeric keys with a bounded error.
+    
+    Attributes:
+    keys (numpy.ndarray): The sorted keys (not copied when already contiguous).
+    max_error (int): Largest distance between a key's predicted and first position.
+    segment_keys (numpy.ndarray): First key of every segment.
+    segment_starts (numpy.ndarray): Position of each segment's first key.
+    segment_slopes (numpy.ndarray): Positions per key unit in each segment.
+    """
+
+    def __init__(self, keys, max_error=32):
+        """
+        Parameters:
+        keys (numpy.ndarray or list): Sorted numeric keys.
+        max_error (int): Error bound of the model, in positions.
+        """
+        self.keys = np.ascontiguousarray(keys)
+        if self.keys.dtype.kind not in "iuf":
+            raise ValueError("LearnedIndex needs numeric keys")
+        self.max_error = max_error
+        self.n = len(self.keys)
+
+        # Fit on distinct keys and their first positions, so duplicates aim at their first copy
+        distinct, first_positions = np.unique(self.keys, return_index=True)
+        segment_keys, segment_starts, segment_slopes = [], [], []
+        if len(distinct):
+            # Python ints keep the offsets from a segment's first key exact: large int64 keys
+            # that differ by less than one float64 step would otherwise give dx == 0
+            xs = distinct.tolist()
+            ys = first_positions.tolist()
+            x0, y0 = xs[0], ys[0]
+            low, high = 0.0, math.inf
+            for x, y in zip(xs[1:], ys[1:]):
+                dx = x - x0
+                next_low = max(low, (y - y0 - max_error) / dx)
+                next_high = min(high, (y - y0 + max_error) / dx)
+                if next_low > next_high:
+                    # This key falls outside the cone: close the segment, start a new one here
+                    segment_keys.append(x0)
+                    segment_starts.append(y0)
+                    segment_slopes.append(low if high == math.inf else (low + high) / 2)
+                    x0, y0 = x, y
+                    low, high = 0.0, math.inf
+                else:
+                    low, high = next_low, next_high
+            segment_keys.append(x0)
+            segment_starts.append(y0)
+            segment_slopes.append(low if high == math.inf else (low + high) / 2)
+
+        self.segment_keys = np.array(segment_keys, dtype=np.float64)
+        self.segment_starts = np.array(segment_starts, dtype=np.int64)
+        self.segment_slopes = np.array(segment_slopes, dtype=np.float64)
+        self.segment_ends = np.append(self.segment_starts[1:], self.n)
+        # memoryviews give fast scalar access for single lookups
+        self.key_view = memoryview(self.keys)
+        self.segment_key_view = memoryview(self.segment_keys)
+
+    @property
+    def nbytes(self):
+        """Memory used by the model itself (the keys are not counted)."""
+        return (self.segment_keys.nbytes + self.segment_starts.nbytes +
+                self.segment_slopes.nbytes + self.segment_ends.nbytes)
+
+    def predict(self, target):
+        """Predicted position of `target`, clamped to its segment."""
+        segment = max(bisect.bisect_right(self.segment_key_view, target) - 1, 0)
+        start = int(self.segment_starts[segment])
+        guess = start + int(self.segment_slopes[segment] * (target - self.segment_keys[segment]))
+        return min(max(guess, start), int(self.segment_ends[segment]))
+
+    def lower_bound(self, target):
+        """Index of the first key >= target (n if there is none)."""
+        if self.n == 0:
+            return 0
+        guess = self.predict(target)
+        keys = self.key_view
+        left = max(guess - self.max_error - 1, 0)
+        right = min(guess + self.max_error + 2, self.n)
+        index = bisect.bisect_left(keys, target, left, right)
+        if index == left and left > 0 and keys[left - 1] >= target:
+            index = bisect.bisect_left(keys, target, 0, left)  # Answer lies left of the window
+        elif index == right < self.n:
+            index = bisect.bisect_left(keys, target, right, self.n)  # Answer lies right of it
+        return index
+
+    def search(self, target):
+        """Index of the first key equal to target, or -1 if it is absent."""
+        index = self.lower_bound(target)
+        if index < self.n and self.key_view[index] == target:
+            return index
+        return -1
+
+    def lower_bound_batch(self, queries):
+        """
+        Lower bounds for many queries: vectorized prediction and window search.
+        
+        Parameters:
+        queries (numpy.ndarray): Values to look up.
+        
+        Returns:
+        numpy.ndarray: int64 index of the first key >= each query.
+        """
+        queries = np.asarray(queries)
+        flat = queries.reshape(-1)
+        if self.n == 0:
+            return np.zeros(queries.shape, dtype=np.int64)
+
+        segments = np.maximum(np.searchsorted(self.segment_keys, flat, side="right") - 1, 0)
+        starts = self.segment_starts[segments]
+        guesses = starts + (self.segment_slopes[segments] * (flat - self.segment_keys[segments])).astype(np.int64)
+        guesses = np.clip(guesses, starts, self.segment_ends[segments])
+
+        # Fixed number of halving steps over every window [left, right) at once
+        window_left = np.maximum(guesses - self.max_error - 1, 0)
+        window_right = np.minimum(guesses + self.max_error + 2, self.n)
+        left, right = window_left.copy(), window_right.copy()
+        for _ in range(int(2 * self.max_error + 3).bit_length()):
+            mid = (left + right) // 2
+            go_right = (left < right) & (self.keys[np.minimum(mid, self.n - 1)] < flat)
+            left = np.where(go_right, mid + 1, left)
+            right = np.where(go_right | (left >= right), right, mid)
+
+        # Rare misses outside the window fall back to a full search
+        outside = ((left == window_left) & (window_left > 0)) | ((left == window_right) & (window_right < self.n))
+        if outside.any():
+            left[outside] = np.searchsorted(self.keys, flat[outside], side="left")
+        return left.reshape(queries.shape)
+
+def benchmark_learned_index(n=1_000_000, num_queries=20_000, max_error=32, seed=0):
+    """
+    Build time, memory and lookup latency of LearnedIndex next to binary_search.
+    
+    Parameters:
+    n (int): Number of sorted keys.
+    num_queries (int): Number of lookups per method.
+    max_error (int): Error bound of the learned model.
+    seed (int): Random seed for keys and queries.
+    
+    Returns:
+    dict: Measured figures, times in seconds.
+    """
+    rng = np.random.default_rng(seed)
+    key_array = np.sort(rng.lognormal(mean=10, sigma=1, size=n))
+    keys = key_array.tolist()
+    queries = rng.choice(key_array, size=num_queries).tolist()
+    query_array = np.array(queries)
+
+    start = time.perf_counter()
+    index = LearnedIndex(key_array, max_error=max_error)
+    results = {"build": time.perf_counter() - start,
+               "segments": len(index.segment_keys),
+               "model bytes": index.nbytes,
+               "key bytes": key_array.nbytes}
+
+    for name, lookup in (
+        ("binary_search", lambda q: binary_search(keys, q)),
+        ("learned index", index.lower_bound),
+    ):
+        start = time.perf_counter()
+        for query in queries:
+            lookup(query)
+        results[name] = (time.perf_counter() - start) / num_queries
+
+    start = time.perf_counter()
+    np.searchsorted(key_array, query_array)
+    results["numpy.searchsorted (batch)"] = (time.perf_counter() - start) / num_queries
+    start = time.perf_counter()
+    index.lower_bound_batch(query_array)
+    results["learned index (batch)"] = (time.perf_counter() - start) / num_queries
+
+    print(f"{n} keys, max error {max_error}: {results['segments']} segments, "
+          f"model {results['model bytes'] / 1024:.1f} KiB vs keys {results['key bytes'] / 1024:.1f} KiB, "
+          f"build {results['build'] * 1e3:.0f} ms")
+    for name in ("binary_search", "learned index", "numpy.searchsorted (batch)", "learned index (batch)"):
+        print(f"{name:>28}: {results[name] * 1e9:8.0f} ns per lookup")
+    return results
+
+def write_record_file(path, records, key="key"):
+    """
+    Sort fixed-width records by key and write them to a file for SortedRecordFile.
+    
+    Parameters:
+    path (str): File to write.
+    records (numpy.ndarray): Records, structured (with a `key` field) or plain numbers.
+    key (str): Name of the key field, or None when the record itself is the key.
+    """
+    records = np.asarray(records)
+    order = np.argsort(records if key is None else records[key], kind="stable")
+    records[order].tofile(path)
+
+class SortedRecordFile:
+    """
+    Binary search over a memory-mapped file of fixed-width records sorted by key.
+    
+    Attributes:
+    records (numpy.memmap): The mapped records.
+    keys (numpy.ndarray): View of the key of every record (no copy).
+    sparse_keys (list): In-memory keys of the first record of every block.
+    block (int): Records per block of the sparse index.
+    """
+
+    def __init__(self, path, dtype, key="key", pages_per_block=64):
+        """
+        Parameters:
+        path (str): File of records sorted by key.
+        dtype (numpy.dtype): Record layout, for example np.dtype([("key", ">u8"), ("value", "S24")]).
+        key (str): Name of the key field, or None when the record itself is the key.
+        pages_per_block (int): Memory pages covered by one sparse index entry.
+        """
+        dtype = np.dtype(dtype)
+        if os.path.getsize(path) % dtype.itemsize:
+            raise ValueError(f"{path} is not a whole number of {dtype.itemsize}-byte records")
+        if os.path.getsize(path):
+            self.records = np.memmap(path, dtype=dtype, mode="r")
+        else:
+            self.records = np.empty(0, dtype=dtype)  # mmap cannot map an empty file
+        self.keys = self.records if key is None else self.records[key]
+        self.n = len(self.records)
+        self.block = max(1, pages_per_block * mmap.PAGESIZE // dtype.itemsize)
+        # One strided pass reads a single key per block; kept as Python values so that
+        # bisect compares them with the target without converting the whole index
+        self.sparse_keys = self.keys[::self.block].tolist()
+
+    def block_range(self, target, side):
+        """Record range [lo, hi] that must hold the answer, found with the sparse index."""
+        if side == "left":
+            block = bisect.bisect_left(self.sparse_keys, target)
+        else:
+            block = bisect.bisect_right(self.sparse_keys, target)
+        lo = max(block - 1, 0) * self.block
+        hi = min(block * self.block, self.n)
+        return lo, hi
+
+    def lower_bound(self, target):
+        """Index of the first record with key >= target (n if there is none)."""
+        lo, hi = self.block_range(target, "left")
+        keys = self.keys
+        # Probe the mapped keys directly: searchsorted would copy the strided block first
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if keys[mid] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def upper_bound(self, target):
+        """Index of the first record with key > target (n if there is none)."""
+        lo, hi = self.block_range(target, "right")
+        keys = self.keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if keys[mid] <= target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def search(self, target):
+        """
+        Find a record by key.
+        
+        Parameters:
+        target: Key to look up, comparable with the key field.
+        
+        Returns:
+        int: Index of the first record with this key, or -1 if there is none.
+        """
+        index = self.lower_bound(target)
+        if index < self.n and self.keys[index] == target:
+            return index
+        return -1
+
+    def range(self, low, high):
+        """Records with low <= key < high, as a view into the mapped file."""
+        return self.records[self.lower_bound(low):self.lower_bound(high)]
+
 # Testing the Binary Search function
 if __name__ == "__main__":
     # A sorted list to search in
@@ -82,13 +758,59 @@ if __name__ == "__main__":
     target_value = 21
 
     print(f"Searching for {target_value} in the list...")
-    result_index = binary_search(sorted_list, target_value)
+    result_index = binary_search(sorted_list, target_value, trace=print_trace)
 
     if result_index != -1:
         print(f"Target {target_value} found at index {result_index}.")
     else:
         print(f"Target {target_value} not found in the list.")
 
+    queries = np.array([3, 13, 21, 30, 31])
+    print(f"Batch search for {queries.tolist()}:")
+    print(f"exact: {binary_search_batch(sorted_list, queries).tolist()}")
+    print(f"lower: {binary_search_batch(sorted_list, queries, mode='lower').tolist()}")
+    print(f"upper: {binary_search_batch(sorted_list, queries, mode='upper').tolist()}")
+
+    index = EytzingerIndex(sorted_list)
+    print(f"Eytzinger layout: {index.layout[1:].tolist()}")
+    print(f"Target {target_value} found at index {index.search(target_value)} using the Eytzinger index.")
+
+    benchmark_static_index(n=200_000, num_queries=20_000)
+
+    record_type = np.dtype([("key", ">u8"), ("value", "S8")])
+    records = np.zeros(100_000, dtype=record_type)
+    records["key"] = np.arange(0, 300_000, 3)
+    records["value"] = [f"v{i}".encode() for i in range(len(records))]
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "records.bin")
+        write_record_file(path, records)
+        on_disk = SortedRecordFile(path, record_type)
+        print(f"Key 2100 found at record {on_disk.search(2100)} of the file.")
+        print(f"Keys in [30, 45): {on_disk.range(30, 45)['key'].tolist()}")
+        del on_disk  # Release the mapping before the folder is removed
+
+    # Probe counts on 1,000,000 roughly uniform keys, for a target 10 places from the end
+    rng = random.Random(1)
+    log_keys = sorted(rng.sample(range(10_000_000), 1_000_000))
+    log_target = log_keys[-10]
+    for name, search in (
+        ("binary_search", binary_search),
+        ("exponential_search from the end", functools.partial(exponential_search, from_end=True)),
+        ("interpolation_search", interpolation_search),
+        ("choose_search", choose_search(log_keys)),
+    ):
+        probes = []
+        index = search(log_keys, log_target, trace=lambda mid, value, target: probes.append(mid))
+        print(f"{name}: index {index} after {len(probes)} probes")
+
+    benchmark_learned_index(n=200_000, num_queries=20_000)
+
+    # Neighboring int64 keys above 2**53 are the same float64 value; the fit must not divide by zero
+    big_keys = np.arange(2**60, 2**60 + 1000, dtype=np.int64)
+    big_index = LearnedIndex(big_keys, max_error=4)
+    assert all(big_index.search(key) == index for index, key in enumerate(big_keys.tolist()))
+    print(f"Key 2**60 + 500 found at index {big_index.search(2**60 + 500)} of {len(big_keys)} large int64 keys.")
+
 # EOF
 
 
@@ -28,29 +28,114 @@ Nodes are dequeued one by one.
 Each dequeued node is marked as visited and added to the result list.
 The neighbors of the current node are enqueued if they haven't been visited yet.
 
+CSR Graphs:
+bfs also accepts a CSRGraph (see CSRGraph.py) and then runs bfs_csr, which walks the
+offsets/targets arrays with integer node ids, a bytearray of visited flags and a list used
+as a queue with a moving head index. Nodes are marked when they are enqueued, which gives
+the same order without queueing duplicates. The result is converted back to labels.
+
+Streaming BFS:
+bfs_stream is a generator that yields (node, depth) pairs one at a time, so a caller can stop
+as soon as it has what it needs. Nodes are marked visited when they are enqueued, so no node
+is queued twice. The depth changes exactly at level boundaries.
+It stops by itself after yielding `target`, the first node for which `predicate` is true,
+or `max_nodes` nodes, and it does not go deeper than `max_depth`.
+is_reachable uses it to answer reachability questions without building the whole result.
+
+Batched BFS:
+batched_bfs computes hop distances from many sources on a CSRGraph in one pass per level.
+Up to 64 sources share a batch. Each node holds a 64-bit word: bit k of seen[v] says that
+source k has reached v, and bit k of frontier[v] says that v is in source k's frontier.
+One scan of the frontier's out-edges ORs the words into the next frontier, so every edge
+is read once per level for all 64 searches instead of once per search.
+The result is a distance matrix (one row per source, -1 for unreachable nodes);
+batched_bfs_rows yields the same rows one by one, a batch at a time, so the whole
+matrix never has to be in memory.
+
+Parallel BFS:
+parallel_bfs runs the top-down levels of bfs across a pool of worker processes.
+The graph arrays, the depth array and the frontier sit in shared memory, so no graph data
+is pickled. Each level, the frontier is cut into chunks with about equal edge counts.
+Each worker scans its chunks, drops already visited nodes and writes the remaining
+(node, parent) candidates into its own region of a shared output buffer. The main
+process then concatenates the regions in frontier order and keeps each node's first
+occurrence. That merge is deterministic and gives exactly the levels, order and parents
+of a serial top-down BFS, whatever the number of processes or how the chunks finish.
+Levels with few edges run in the main process, where the pool would only add overhead.
+benchmark_parallel_bfs times one graph with 1, 2, 4, ... processes to record the speedup
+curve of the machine it runs on. Expect the gain to flatten well before the core count:
+the merge is serial and the scans are bound by memory bandwidth. On a single-core
+machine the pool can only add overhead (speedup below 1).
+
+Direction-Optimizing BFS:
+direction_optimizing_bfs runs one level at a time on a CSRGraph with NumPy array operations.
+A top-down step scans the out-edges of the frontier, like bfs. On low-diameter graphs the
+middle levels reach almost every node, and most of those edge checks find visited nodes.
+A bottom-up step instead lets every unvisited node look through its in-edges for a parent
+in the frontier, and it stops at the first one it finds.
+The step is chosen per level (Beamer's heuristic):
+switch to bottom-up when the frontier's out-edges exceed the unvisited nodes' in-edges / alpha,
+and back to top-down once the frontier holds fewer than V / beta nodes.
+The visited set and the frontier are bit arrays (one bit per node, packed into bytes).
+It returns the BFS order together with depth and parent arrays indexed by node id
+(-1 for unreached nodes). Levels and depths equal those of bfs; top-down levels list
+nodes in the same order as bfs, bottom-up levels list them by node id.
+
 Output
 BFS traversal starting from A:
 ['A', 'B', 'C', 'D', 'E', 'F']
 
+BFS traversal of the CSR graph starting from A:
+['A', 'B', 'C', 'D', 'E', 'F']
+
+Streaming BFS from A down to depth 1:
+A at depth 0
+B at depth 1
+C at depth 1
+Path from A to E: True, from C to E: False
+
+Hop distances from A, B and C:
+['A', 'B', 'C', 'D', 'E', 'F']
+[[ 0  1  1  2  2  2]
+ [-1  0 -1  1  1  2]
+ [-1 -1  0 -1 -1  1]]
+
+Direction-optimizing BFS starting from A:
+['A', 'B', 'C', 'D', 'E', 'F']
+depth:  {'A': 0, 'B': 1, 'C': 1, 'D': 2, 'E': 2, 'F': 2}
+parent: {'B': 'A', 'C': 'A', 'D': 'B', 'E': 'B', 'F': 'C'}
+steps:  ['bottom-up', 'bottom-up', 'bottom-up']
+
 """
 
 # Breadth-First Search (BFS) Algorithm
 # Astro Pema Software (c)
 # Oba Ozai Nov 2024
 
+import multiprocessing
+import time
 from collections import deque
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from CSRGraph import CSRGraph, gather_ranges
 
 def bfs(graph, start):
     """
     Perform Breadth-First Search on a graph using a queue.
     
     Parameters:
-    graph (dict): Adjacency list representation of the graph.
+    graph (dict or CSRGraph): Adjacency list representation of the graph.
     start (str): The starting node for BFS.
     
     Returns:
     list: A list of nodes visited in BFS order.
     """
+    if isinstance(graph, CSRGraph):
+        labels = graph.labels
+        return [labels[node] for node in bfs_csr(graph, graph.id_of(start)).tolist()]
+
     visited = set()          # To keep track of visited nodes
     queue = deque([start])   # Queue to manage the nodes to visit
     result = []
@@ -70,6 +155,490 @@ def bfs(graph, start):
 
     return result
 
+def bfs_csr(graph, source):
+    """
+    Perform Breadth-First Search on a CSR graph using integer node ids.
+
+    Parameters:
+    graph (CSRGraph): The graph.
+    source (int): Node id of the starting node.
+
+    Returns:
+    numpy.ndarray: Node ids in BFS order.
+    """
+    offsets = memoryview(graph.offsets)
+    targets = memoryview(graph.targets)
+    visited = bytearray(graph.num_nodes)
+    visited[source] = 1
+    queue = [source]
+    head = 0
+
+    while head < len(queue):
+        node = queue[head]
+        head += 1
+        for neighbor in targets[offsets[node]:offsets[node + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                queue.append(neighbor)
+
+    return np.array(queue, dtype=graph.targets.dtype)
+
+def bfs_stream(graph, start, target=None, predicate=None, max_depth=None, max_nodes=None):
+    """
+    Generate the nodes of a Breadth-First Search lazily, with their depths.
+
+    Parameters:
+    graph (dict or CSRGraph): Adjacency list representation of the graph.
+    start (str): The starting node for BFS.
+    target (str): Stop after yielding this node.
+    predicate (callable): Stop after yielding the first node for which predicate(node) is true.
+    max_depth (int): Do not visit nodes deeper than this.
+    max_nodes (int): Stop after yielding this many nodes.
+
+    Yields:
+    tuple: (node, depth) in BFS order.
+    """
+    if isinstance(graph, CSRGraph):
+        labels = graph.labels
+        target_id = None if target is None else graph.id_of(target)
+        node_predicate = None if predicate is None else (lambda node: predicate(labels[node]))
+        for node, depth in bfs_stream_csr(graph, graph.id_of(start), target_id, node_predicate,
+                                          max_depth, max_nodes):
+            yield labels[node], depth
+        return
+
+    if max_nodes is not None and max_nodes <= 0:
+        return                       # The limit is checked after each yield, so 0 needs its own check
+    visited = {start}                # Nodes are marked when they are enqueued
+    queue = deque([(start, 0)])
+    count = 0
+
+    while queue:
+        node, depth = queue.popleft()
+        yield node, depth
+        count += 1
+
+        if (target is not None and node == target) or (predicate is not None and predicate(node)):
+            return
+        if max_nodes is not None and count >= max_nodes:
+            return
+        if depth == max_depth:
+            continue
+
+        for neighbor in graph[node]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, depth + 1))
+
+def bfs_stream_csr(graph, source, target=None, predicate=None, max_depth=None, max_nodes=None):
+    """
+    bfs_stream on a CSR graph using integer node ids.
+
+    Parameters:
+    graph (CSRGraph): The graph.
+    source (int): Node id of the starting node.
+    target (int): Stop after yielding this node id.
+    predicate (callable): Stop after yielding the first node id for which predicate(id) is true.
+    max_depth (int): Do not visit nodes deeper than this.
+    max_nodes (int): Stop after yielding this many nodes.
+
+    Yields:
+    tuple: (node id, depth) in BFS order.
+    """
+    if max_nodes is not None and max_nodes <= 0:
+        return
+    offsets = memoryview(graph.offsets)
+    targets = memoryview(graph.targets)
+    visited = bytearray(graph.num_nodes)
+    visited[source] = 1
+    queue = [source]
+    depths = [0]
+    head = 0
+
+    while head < len(queue):
+        node, depth = queue[head], depths[head]
+        head += 1
+        yield node, depth
+
+        if node == target or (predicate is not None and predicate(node)):
+            return
+        if max_nodes is not None and head >= max_nodes:
+            return
+        if depth == max_depth:
+            continue
+
+        for neighbor in targets[offsets[node]:offsets[node + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                queue.append(neighbor)
+                depths.append(depth + 1)
+
+def is_reachable(graph, start, target, max_depth=None):
+    """
+    Check whether `target` can be reached from `start`, stopping as soon as it is found.
+
+    Parameters:
+    graph (dict or CSRGraph): Adjacency list representation of the graph.
+    start (str): The starting node.
+    target (str): The node to look for.
+    max_depth (int): Only accept paths of at most this many edges.
+
+    Returns:
+    bool: True if target is reachable.
+    """
+    for node, _ in bfs_stream(graph, start, target=target, max_depth=max_depth):
+        if node == target:
+            return True
+    return False
+
+def batched_bfs_rows(graph, sources, max_depth=None):
+    """
+    Hop distances from many sources, computed 64 sources at a time and yielded row by row.
+
+    Parameters:
+    graph (CSRGraph): The graph.
+    sources (list): Node ids of the sources.
+    max_depth (int): Do not search deeper than this; farther nodes get -1.
+
+    Yields:
+    tuple: (source, row) where row[v] is the hop distance from source to node v, or -1.
+    """
+    n = graph.num_nodes
+    offsets, targets = graph.offsets, graph.targets
+    out_degree = np.diff(offsets)
+    sources = np.asarray(sources, dtype=np.int64)
+
+    for batch_start in range(0, len(sources), 64):
+        batch = sources[batch_start:batch_start + 64]
+        bits = np.left_shift(np.uint64(1), np.arange(len(batch), dtype=np.uint64))
+        distances = np.full((len(batch), n), -1, dtype=np.int32)
+        distances[np.arange(len(batch)), batch] = 0
+
+        frontier = np.zeros(n, dtype=np.uint64)
+        np.bitwise_or.at(frontier, batch, bits)   # Several sources may share a node
+        seen = frontier.copy()
+        active = np.flatnonzero(frontier)
+        level = 0
+
+        while active.size and level != max_depth:
+            level += 1
+            # Push every active node's word along its out-edges
+            edges = gather_ranges(offsets[active], offsets[active + 1])
+            words = np.repeat(frontier[active], out_degree[active])
+            reached = np.zeros(n, dtype=np.uint64)
+            np.bitwise_or.at(reached, targets[edges], words)
+            reached &= ~seen
+            seen |= reached
+            frontier = reached
+            active = np.flatnonzero(frontier)
+
+            # Which sources reached which node for the first time at this level
+            hits = (frontier[active, None] >> np.arange(len(batch), dtype=np.uint64)) & np.uint64(1)
+            node_index, source_index = np.nonzero(hits)
+            distances[source_index, active[node_index]] = level
+
+        for source, row in zip(batch.tolist(), distances):
+            yield source, row
+
+def batched_bfs(graph, sources, max_depth=None):
+    """
+    Hop distance matrix from many sources; see batched_bfs_rows.
+
+    Parameters:
+    graph (CSRGraph): The graph.
+    sources (list): Node ids of the sources.
+    max_depth (int): Do not search deeper than this; farther nodes get -1.
+
+    Returns:
+    numpy.ndarray: int32 matrix with one row per source and one column per node.
+    """
+    distances = np.empty((len(sources), graph.num_nodes), dtype=np.int32)
+    for index, (_, row) in enumerate(batched_bfs_rows(graph, sources, max_depth)):
+        distances[index] = row
+    return distances
+
+def expand_frontier(arrays, start, end, out_start):
+    """
+    Scan the out-edges of frontier[start:end] and write the unvisited targets, each once,
+    with their parents to found/parents from index out_start on.
+
+    Parameters:
+    arrays (dict): The "offsets", "targets", "depth", "frontier", "found" and "parents" arrays.
+    start, end (int): Slice of the frontier to expand.
+    out_start (int): First output index; the slice has room for all of its out-edges.
+
+    Returns:
+    int: Number of candidates written.
+    """
+    offsets, targets, depth = arrays["offsets"], arrays["targets"], arrays["depth"]
+    frontier = arrays["frontier"][start:end]
+    edges = gather_ranges(offsets[frontier], offsets[frontier + 1])
+    candidates = targets[edges]
+    sources = np.repeat(frontier, offsets[frontier + 1] - offsets[frontier])
+    keep = depth[candidates] < 0
+    candidates, sources = candidates[keep], sources[keep]
+    _, first = np.unique(candidates, return_index=True)
+    first.sort()
+    count = len(first)
+    arrays["found"][out_start:out_start + count] = candidates[first]
+    arrays["parents"][out_start:out_start + count] = sources[first]
+    return count
+
+def attach_bfs_arrays(specs):
+    """Pool initializer: map the shared BFS arrays into this worker process."""
+    global bfs_memories, bfs_arrays
+    bfs_memories = []
+    bfs_arrays = {}
+    for key, (name, dtype, size) in specs.items():
+        memory = shared_memory.SharedMemory(name=name)
+        bfs_memories.append(memory)
+        bfs_arrays[key] = np.ndarray(size, dtype=dtype, buffer=memory.buf)
+
+def expand_frontier_task(task):
+    """Pool task: expand one (start, end, out_start) chunk of the shared frontier."""
+    return expand_frontier(bfs_arrays, *task)
+
+def parallel_bfs(graph, source, processes=None, chunks_per_process=4, min_parallel_edges=100_000):
+    """
+    Level-synchronous top-down BFS with each level's edge scan spread over worker processes.
+
+    Parameters:
+    graph (CSRGraph): The graph.
+    source (int): Node id of the starting node.
+    processes (int): Number of worker processes, os.cpu_count() by default; 1 runs in this process.
+    chunks_per_process (int): Frontier chunks per process and level, for load balance.
+    min_parallel_edges (int): Levels with fewer frontier out-edges run in this process.
+
+    Returns:
+    tuple: (order, depth, parent) as in direction_optimizing_bfs; the order is the order of bfs.
+    """
+    n = graph.num_nodes
+    dtype = graph.targets.dtype
+    out_degree = np.diff(graph.offsets)
+    processes = processes or multiprocessing.cpu_count()
+    sizes = {"offsets": (np.int64, n + 1), "targets": (dtype, graph.num_edges),
+             "depth": (dtype, n), "frontier": (dtype, n),
+             "found": (dtype, graph.num_edges), "parents": (dtype, graph.num_edges)}
+
+    memories = {}
+    arrays = {}
+    pool = None
+    try:
+        for key, (array_dtype, size) in sizes.items():
+            memory = shared_memory.SharedMemory(create=True, size=max(np.dtype(array_dtype).itemsize * size, 1))
+            memories[key] = memory
+            arrays[key] = np.ndarray(size, dtype=array_dtype, buffer=memory.buf)
+        arrays["offsets"][:] = graph.offsets
+        arrays["targets"][:] = graph.targets
+        arrays["depth"][:] = -1
+        arrays["depth"][source] = 0
+        arrays["frontier"][0] = source
+        if processes > 1:
+            specs = {key: (memories[key].name, sizes[key][0], sizes[key][1]) for key in sizes}
+            pool = multiprocessing.Pool(processes, initializer=attach_bfs_arrays, initargs=(specs,))
+
+        parent = np.full(n, -1, dtype=dtype)
+        levels = [np.array([source], dtype=dtype)]
+        size = 1
+        while size:
+            # Cut the frontier into chunks of about equal edge counts
+            edge_ends = np.cumsum(out_degree[arrays["frontier"][:size]])
+            total = int(edge_ends[-1])
+            if pool is None or total < min_parallel_edges:
+                tasks = [(0, size, 0)]
+            else:
+                num_chunks = min(size, processes * chunks_per_process)
+                cuts = np.searchsorted(edge_ends, np.arange(1, num_chunks) * total // num_chunks, side='right')
+                bounds = np.unique(np.concatenate([[0], cuts, [size]]))
+                tasks = [(int(start), int(end), int(edge_ends[start - 1]) if start else 0)
+                         for start, end in zip(bounds[:-1], bounds[1:])]
+
+            if len(tasks) == 1:
+                counts = [expand_frontier(arrays, *tasks[0])]
+            else:
+                counts = pool.map(expand_frontier_task, tasks, chunksize=1)
+
+            # Deterministic merge: chunks in frontier order, first occurrence of each node wins
+            found = np.concatenate([arrays["found"][out:out + count] for (_, _, out), count in zip(tasks, counts)])
+            parents = np.concatenate([arrays["parents"][out:out + count] for (_, _, out), count in zip(tasks, counts)])
+            _, first = np.unique(found, return_index=True)
+            first.sort()
+            found, parents = found[first], parents[first]
+
+            arrays["depth"][found] = len(levels)
+            parent[found] = parents
+            arrays["frontier"][:len(found)] = found
+            size = len(found)
+            levels.append(found)
+
+        return np.concatenate(levels), arrays["depth"].copy(), parent
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        arrays.clear()  # The views must go before the blocks can be closed
+        for memory in memories.values():
+            memory.close()
+            memory.unlink()
+
+def benchmark_parallel_bfs(graph, source=0, process_counts=None):
+    """
+    Time parallel_bfs on one graph with a growing number of processes.
+
+    Parameters:
+    graph (CSRGraph): The graph.
+    source (int): Node id of the starting node.
+    process_counts (list): Process counts to try; 1, 2, 4, ... up to os.cpu_count() by default.
+
+    Returns:
+    dict: Seconds per run for each process count.
+    """
+    if process_counts is None:
+        process_counts = [1]
+        while process_counts[-1] * 2 <= multiprocessing.cpu_count():
+            process_counts.append(process_counts[-1] * 2)
+
+    timings = {}
+    for processes in process_counts:
+        start = time.perf_counter()
+        parallel_bfs(graph, source, processes=processes)
+        timings[processes] = time.perf_counter() - start
+
+    print(f"{graph.num_nodes} nodes, {graph.num_edges} edges, {multiprocessing.cpu_count()} cores")
+    for processes, seconds in timings.items():
+        print(f"{processes:>3} processes: {seconds * 1000:8.1f} ms, speedup {timings[process_counts[0]] / seconds:.2f}")
+    return timings
+
+def new_bitset(size):
+    """Bit array of `size` zero bits packed into bytes (bit i is bit i % 8 of byte i // 8)."""
+    return np.zeros((size + 7) // 8, dtype=np.uint8)
+
+def set_bits(bits, ids):
+    """Set the bits of all node ids in `ids`."""
+    np.bitwise_or.at(bits, ids >> 3, np.left_shift(1, ids & 7).astype(np.uint8))
+
+def test_bits(bits, ids):
+    """Boolean array telling which node ids in `ids` have their bit set."""
+    return (bits[ids >> 3] >> (ids & 7).astype(np.uint8)) & 1 == 1
+
+def direction_optimizing_bfs(graph, source, alpha=14, beta=24, in_edges=None, stats=None):
+    """
+    Level-synchronous BFS that switches between top-down and bottom-up steps.
+
+    Parameters:
+    graph (CSRGraph): The graph.
+    source (int): Node id of the starting node.
+    alpha (float): Go bottom-up when frontier out-edges > unvisited in-edges / alpha;
+                   0 keeps every step top-down.
+    beta (float): Go back top-down when the frontier has fewer than V / beta nodes.
+    in_edges (tuple): graph.in_edges(), to reuse it across calls on the same graph.
+    stats (dict): Optional; receives 'steps', the direction used for each level.
+
+    Returns:
+    tuple: (order, depth, parent) arrays of node ids; depth and parent are -1 for
+           unreached nodes and parent is -1 for the source.
+    """
+    n = graph.num_nodes
+    offsets, targets = graph.offsets, graph.targets
+    in_offsets, in_edge_ids = graph.in_edges() if in_edges is None else in_edges
+    in_sources = graph.sources()[in_edge_ids]
+    out_degree = np.diff(offsets)
+    in_degree = np.diff(in_offsets)
+
+    depth = np.full(n, -1, dtype=targets.dtype)
+    parent = np.full(n, -1, dtype=targets.dtype)
+    visited = new_bitset(n)
+    frontier = np.array([source], dtype=targets.dtype)
+    set_bits(visited, frontier)
+    depth[source] = 0
+    levels = [frontier]
+    unvisited_edges = int(in_degree.sum() - in_degree[source])
+    top_down = True
+    steps = []
+
+    while frontier.size:
+        if top_down and out_degree[frontier].sum() * alpha > unvisited_edges:
+            top_down = False
+        elif not top_down and frontier.size < n / beta:
+            top_down = True
+
+        if top_down:
+            # Out-edges of the frontier in frontier order; the first hit on a node wins
+            edges = gather_ranges(offsets[frontier], offsets[frontier + 1])
+            candidates = targets[edges]
+            sources = np.repeat(frontier, out_degree[frontier])
+            keep = ~test_bits(visited, candidates)
+            candidates, sources = candidates[keep], sources[keep]
+            _, first = np.unique(candidates, return_index=True)
+            first.sort()
+            found, found_parents = candidates[first], sources[first]
+        else:
+            frontier_bits = new_bitset(n)
+            set_bits(frontier_bits, frontier)
+            unvisited = np.flatnonzero(np.unpackbits(visited, count=n, bitorder='little') == 0)
+            found, found_parents = bottom_up_step(unvisited, in_offsets, in_degree,
+                                                  in_sources, frontier_bits)
+
+        steps.append("top-down" if top_down else "bottom-up")
+        set_bits(visited, found)
+        depth[found] = len(levels)
+        parent[found] = found_parents
+        unvisited_edges -= int(in_degree[found].sum())
+        levels.append(found)
+        frontier = found
+
+    if stats is not None:
+        stats['steps'] = steps
+    return np.concatenate(levels), depth, parent
+
+def bottom_up_step(unvisited, in_offsets, in_degree, in_sources, frontier_bits, batch_floor=1024):
+    """
+    One bottom-up BFS step: find a frontier parent for each unvisited node that has one.
+
+    Round r checks the r-th in-edge of every node still searching, so a node stops scanning
+    at its first frontier parent. Once fewer than `batch_floor` nodes are still searching,
+    their remaining in-edges are checked together in one pass.
+
+    Parameters:
+    unvisited (numpy.ndarray): Ids of the unvisited nodes, in increasing order.
+    in_offsets, in_degree, in_sources (numpy.ndarray): In-edges grouped by target node.
+    frontier_bits (numpy.ndarray): Bit array of the current frontier.
+    batch_floor (int): Active-set size below which the rounds stop.
+
+    Returns:
+    tuple: (found, parents), the nodes of the next level in id order and a parent of each.
+    """
+    found = []
+    parents = []
+    active = unvisited[in_degree[unvisited] > 0]
+    position = in_offsets[active]
+    end = in_offsets[active + 1]
+
+    while active.size >= batch_floor:
+        candidates = in_sources[position]
+        hit = test_bits(frontier_bits, candidates)
+        found.append(active[hit])
+        parents.append(candidates[hit])
+        position += 1
+        searching = ~hit & (position < end)
+        active, position, end = active[searching], position[searching], end[searching]
+
+    if active.size:
+        edges = gather_ranges(position, end)
+        nodes = np.repeat(active, end - position)
+        candidates = in_sources[edges]
+        hit = test_bits(frontier_bits, candidates)
+        nodes, candidates = nodes[hit], candidates[hit]
+        # Keep the first frontier in-edge of each node
+        _, first = np.unique(nodes, return_index=True)
+        found.append(nodes[first])
+        parents.append(candidates[first])
+
+    found = np.concatenate(found) if found else unvisited[:0]
+    parents = np.concatenate(parents) if parents else unvisited[:0]
+    order = np.argsort(found, kind='stable')
+    return found[order].astype(in_sources.dtype), parents[order]
+
 # Sample graph (adjacency list)
 graph = {
     'A': ['B', 'C'],
@@ -86,6 +655,56 @@ if __name__ == "__main__":
     print(f"BFS traversal starting from {start_node}:")
     print(bfs(graph, start_node))
 
+    print(f"\nBFS traversal of the CSR graph starting from {start_node}:")
+    print(bfs(CSRGraph.from_dict(graph), start_node))
+
+    print(f"\nStreaming BFS from {start_node} down to depth 1:")
+    for node, depth in bfs_stream(graph, start_node, max_depth=1):
+        print(f"{node} at depth {depth}")
+    print(f"Path from A to E: {is_reachable(graph, 'A', 'E')}, from C to E: {is_reachable(graph, 'C', 'E')}")
+    # max_nodes is an exact cap, including 0, for both graph formats
+    for stream_graph in (graph, CSRGraph.from_dict(graph)):
+        assert [len(list(bfs_stream(stream_graph, start_node, max_nodes=limit))) for limit in range(4)] == [0, 1, 2, 3]
+
+    csr = CSRGraph.from_dict(graph)
+    stats = {}
+    order, depth, parent = direction_optimizing_bfs(csr, csr.id_of(start_node), stats=stats)
+    print(f"\nDirection-optimizing BFS starting from {start_node}:")
+    print([csr.labels[node] for node in order.tolist()])
+    print("depth: ", {csr.labels[node]: int(depth[node]) for node in order.tolist()})
+    print("parent:", {csr.labels[node]: csr.labels[parent[node]] for node in order.tolist()[1:]})
+    print("steps: ", stats['steps'])
+
+    print("\nHop distances from A, B and C:")
+    print(f"{csr.labels}")
+    print(batched_bfs(csr, [csr.id_of(label) for label in "ABC"]))
+
+    # Low-diameter random graph: the middle levels switch to bottom-up steps
+    rng = np.random.default_rng(1)
+    nodes, edges = 200_000, 3_000_000
+    sources = np.sort(rng.integers(0, nodes, edges))
+    offsets = np.searchsorted(sources, np.arange(nodes + 1))
+    big = CSRGraph(offsets, rng.integers(0, nodes, edges))
+    reverse = big.in_edges()
+    for label, alpha in (("top-down only", 0), ("direction-optimizing", 14)):
+        stats = {}
+        start = time.perf_counter()
+        order, depth, parent = direction_optimizing_bfs(big, 0, alpha=alpha, in_edges=reverse, stats=stats)
+        elapsed = time.perf_counter() - start
+        print(f"{label:>21}: {elapsed * 1000:7.1f} ms, {order.size} nodes reached, steps {stats['steps']}")
+
+    benchmark_parallel_bfs(big, 0, process_counts=sorted({1, 2, multiprocessing.cpu_count()}))
+
+    seeds = list(range(64))
+    start = time.perf_counter()
+    for seed in seeds[:16]:
+        direction_optimizing_bfs(big, seed, alpha=0, in_edges=reverse)
+    one_by_one = (time.perf_counter() - start) / 16
+    start = time.perf_counter()
+    distances = batched_bfs(big, seeds)
+    batched = (time.perf_counter() - start) / len(seeds)
+    print(f"Per source: {one_by_one * 1000:.1f} ms one at a time, {batched * 1000:.1f} ms in a batch of 64")
+
 # EOF
 
 
@@ -0,0 +1,451 @@
+"""
+
+Contraction Hierarchies (CH) Overview
+Contraction Hierarchies answer many shortest-path queries on a fixed road graph far faster
+than running Dijkstra's Algorithm for each one. The work is split in two:
+a preprocessing step, run once per graph, and a query step that settles only a few
+hundred vertices even on large networks.
+
+Preprocessing:
+Vertices are contracted one at a time, from least to most important. Contracting v removes
+it from the graph. For every pair of remaining neighbors u -> v -> w, a shortcut edge u -> w
+with weight w(u, v) + w(v, w) is added, unless a "witness" path from u to w that avoids v is
+at least as short. The contraction order gives every vertex a rank.
+
+Query:
+Every shortest path can be rewritten to climb to its highest-ranked vertex and then
+descend, using original edges and shortcuts. A query therefore runs a forward Dijkstra from
+the start that only follows edges up to higher ranks, plus a backward Dijkstra from the
+target that also only moves up. The shortest sum over vertices reached by both searches
+is the distance.
+
+Time Complexity:
+Preprocessing time depends on the graph and the node order; road networks typically end up
+with about as many shortcuts as original edges.
+A query settles a small, almost size-independent part of the graph.
+
+Explanation of the Code
+Node Order:
+The priority of a vertex is its edge difference (shortcuts it would add minus edges it would
+remove) plus the number of its neighbors already contracted, which spreads the contractions
+evenly. Priorities are kept in a heap and updated lazily: a popped vertex is re-evaluated and
+pushed back if it is no longer the smallest. The neighbors of each contracted vertex are
+re-evaluated right away, with a cheaper witness search (estimate_settled) because only the
+order depends on it; the shortcuts actually added always come from the full search.
+
+Witness Search:
+A Dijkstra from u that skips v and stops once every w is settled, past the largest
+shortcut weight, or after max_settled vertices. When the limit cuts a search short, the shortcut is added anyway;
+an unneeded shortcut costs a little space but never a wrong answer.
+
+Storage:
+The hierarchy is two CSR graphs: upward edges for the forward search, and (reversed)
+downward edges for the backward search. Each edge records the middle vertex of the
+shortcut it stands for, or -1 for an original edge. save() writes them to a .npz file,
+and load() reads them back without repeating the preprocessing. Labels are saved the way
+the CSR graph file stores them, as integers or as UTF-8 text, so they come back unchanged.
+
+Path Unpacking:
+A shortcut u -> w with middle vertex v is replaced by u -> v and v -> w, which may be
+shortcuts themselves. This continues with an explicit stack until only original edges remain.
+
+Output
+Contraction Hierarchy for the sample graph:
+Ranks: {'A': 0, 'B': 2, 'C': 3, 'D': 1}
+Shortest path from A to D: (4.0, ['A', 'B', 'C', 'D'])
+
+"""
+
+# Contraction Hierarchies Algorithm
+
+import heapq
+import numbers
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from CSRGraph import LABELS_INTEGERS, LABELS_STRINGS, CSRGraph, LabelTable
+from Dijkstra import bidirectional_dijkstra, grid_road_graph
+
+def witness_distances(out_edges, source, skipped, targets, max_distance, max_settled):
+    """
+    Dijkstra from source in the uncontracted graph without `skipped`, cut short early.
+
+    Parameters:
+    out_edges (list of dict): Remaining out-edges {target: weight} of every vertex.
+    source (int): Vertex to search from.
+    skipped (int): Vertex being contracted, which the search must avoid.
+    targets (collection): Stop once all of these are settled.
+    max_distance (float): Stop once the closest unsettled vertex is farther than this.
+    max_settled (int): Stop after settling this many vertices.
+
+    Returns:
+    dict: Tentative distance of every vertex reached.
+    """
+    distances = {source: 0.0}
+    priority_queue = [(0.0, source)]
+    settled = 0
+    remaining = len(targets)
+    while priority_queue:
+        distance, vertex = heapq.heappop(priority_queue)
+        if distance > distances[vertex]:
+            continue
+        if distance > max_distance or settled == max_settled:
+            break
+        settled += 1
+        if vertex in targets:
+            remaining -= 1
+            if not remaining:
+                break
+        for neighbor, weight in out_edges[vertex].items():
+            if neighbor == skipped:
+                continue
+            candidate = distance + weight
+            if candidate < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = candidate
+                heapq.heappush(priority_queue, (candidate, neighbor))
+    return distances
+
+def needed_shortcuts(out_edges, in_edges, vertex, max_settled):
+    """
+    Shortcuts that contracting `vertex` requires.
+
+    Parameters:
+    out_edges, in_edges (list of dict): Remaining edges of every vertex, by direction.
+    vertex (int): Vertex to contract.
+    max_settled (int): Witness search limit.
+
+    Returns:
+    list of tuple: (u, w, weight) for every shortcut u -> w.
+    """
+    shortcuts = []
+    for source, in_weight in in_edges[vertex].items():
+        through = {target: in_weight + out_weight
+                   for target, out_weight in out_edges[vertex].items() if target != source}
+        if not through:
+            continue
+        witness = witness_distances(out_edges, source, vertex, through, max(through.values()), max_settled)
+        for target, weight in through.items():
+            if witness.get(target, float('infinity')) > weight:
+                shortcuts.append((source, target, weight))
+    return shortcuts
+
+class ContractionHierarchy:
+    """
+    Preprocessed road graph for fast point-to-point shortest-path queries.
+
+    Attributes:
+    rank (numpy.ndarray): Contraction rank of every vertex (0 = contracted first).
+    up (CSRGraph): Edges from each vertex to higher-ranked vertices.
+    down (CSRGraph): Edges into each vertex from higher-ranked vertices, reversed.
+    up_middle, down_middle (numpy.ndarray): Middle vertex of each shortcut edge, -1 for original edges.
+    labels (sequence): Label of each vertex id.
+    """
+
+    def __init__(self, rank, up, up_middle, down, down_middle, labels=None):
+        self.rank = rank
+        self.up = up
+        self.up_middle = up_middle
+        self.down = down
+        self.down_middle = down_middle
+        self.labels = range(len(rank)) if labels is None else labels
+        self.ids = {label: vertex for vertex, label in enumerate(self.labels)}
+        self.num_shortcuts = int((up_middle >= 0).sum() + (down_middle >= 0).sum())
+
+        # Middle vertex of every shortcut (u, w), for unpacking
+        self.middle = {}
+        for graph, middles, upward in ((up, up_middle, True), (down, down_middle, False)):
+            sources = graph.sources().tolist()
+            for source, target, middle in zip(sources, graph.targets.tolist(), middles.tolist()):
+                if middle >= 0:
+                    self.middle[(source, target) if upward else (target, source)] = middle
+
+        self.up_offsets = up.offsets.tolist()
+        self.up_targets = up.targets.tolist()
+        self.up_weights = up.weights.tolist()
+        self.down_offsets = down.offsets.tolist()
+        self.down_targets = down.targets.tolist()
+        self.down_weights = down.weights.tolist()
+
+    @classmethod
+    def build(cls, graph, max_settled=60, estimate_settled=10, stats=None):
+        """
+        Contract every vertex of a weighted graph and collect the hierarchy.
+
+        Parameters:
+        graph (dict or CSRGraph): Vertices mapped to lists of (neighbor, weight) tuples.
+        max_settled (int): Witness search limit; smaller is faster but adds more shortcuts.
+        estimate_settled (int): Smaller witness search limit for priority updates only.
+        stats (dict): Optional; receives 'shortcuts' (kept in the hierarchy), 'added'
+                      (including ones later replaced by lighter shortcuts) and 'seconds'.
+
+        Returns:
+        ContractionHierarchy: The preprocessed graph.
+        """
+        started = time.perf_counter()
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph, weighted=True)
+        if graph.weights is None:
+            raise ValueError("Contraction Hierarchies need a weighted graph")
+        n = graph.num_nodes
+
+        # Remaining graph as dictionaries, keeping the lightest of parallel edges
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for source, target, weight in zip(graph.sources().tolist(), graph.targets.tolist(),
+                                          graph.weights.tolist()):
+            if source != target and weight < out_edges[source].get(target, float('infinity')):
+                out_edges[source][target] = weight
+                in_edges[target][source] = weight
+        middle = {}
+
+        contracted_neighbors = [0] * n
+        level = [0] * n
+        def evaluate(vertex, limit):
+            shortcuts = needed_shortcuts(out_edges, in_edges, vertex, limit)
+            removed = len(out_edges[vertex]) + len(in_edges[vertex])
+            return len(shortcuts) - removed + contracted_neighbors[vertex] + level[vertex], shortcuts
+
+        current_priority = [evaluate(vertex, estimate_settled)[0] for vertex in range(n)]
+        queue = [(priority, vertex) for vertex, priority in enumerate(current_priority)]
+        heapq.heapify(queue)
+        rank = np.full(n, -1, dtype=np.int64)
+        up_edges = [None] * n
+        down_edges = [None] * n
+        added = 0
+        next_rank = 0
+
+        while queue:
+            priority, vertex = heapq.heappop(queue)
+            if rank[vertex] >= 0 or priority != current_priority[vertex]:
+                continue  # Stale entry
+            # Lazy update: re-evaluate and put it back if another vertex is now cheaper
+            priority, shortcuts = evaluate(vertex, max_settled)
+            current_priority[vertex] = priority
+            if queue and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, vertex))
+                continue
+
+            for source, target, weight in shortcuts:
+                if weight < out_edges[source].get(target, float('infinity')):
+                    out_edges[source][target] = weight
+                    in_edges[target][source] = weight
+                    middle[(source, target)] = vertex
+                    added += 1
+
+            # Every edge still attached to the vertex leads to a higher rank
+            up_edges[vertex] = [(target, weight, middle.get((vertex, target), -1))
+                                for target, weight in out_edges[vertex].items()]
+            down_edges[vertex] = [(source, weight, middle.get((source, vertex), -1))
+                                  for source, weight in in_edges[vertex].items()]
+            rank[vertex] = next_rank
+            next_rank += 1
+
+            neighbors = set(out_edges[vertex]) | set(in_edges[vertex])
+            for target in out_edges[vertex]:
+                del in_edges[target][vertex]
+            for source in in_edges[vertex]:
+                del out_edges[source][vertex]
+            out_edges[vertex] = {}
+            in_edges[vertex] = {}
+            for neighbor in neighbors:
+                contracted_neighbors[neighbor] += 1
+                level[neighbor] = max(level[neighbor], level[vertex] + 1)
+                current_priority[neighbor] = evaluate(neighbor, estimate_settled)[0]
+                heapq.heappush(queue, (current_priority[neighbor], neighbor))
+
+        hierarchy = cls(rank, *edge_lists_to_csr(up_edges), *edge_lists_to_csr(down_edges), graph.labels)
+        if stats is not None:
+            stats['shortcuts'] = hierarchy.num_shortcuts
+            stats['added'] = added
+            stats['seconds'] = time.perf_counter() - started
+        return hierarchy
+
+    def save(self, path):
+        """
+        Write the hierarchy to a .npz file.
+
+        Labels must be all integers or all strings; any other labels (mixed types,
+        tuples, ...) raise ValueError, because load() could not give them back unchanged.
+        """
+        arrays = {"rank": self.rank}
+        for name, graph, middles in (("up", self.up, self.up_middle), ("down", self.down, self.down_middle)):
+            arrays[name + "_offsets"] = graph.offsets
+            arrays[name + "_targets"] = graph.targets
+            arrays[name + "_weights"] = graph.weights
+            arrays[name + "_middle"] = middles
+        if not isinstance(self.labels, range):
+            labels = list(self.labels)
+            if all(isinstance(label, numbers.Integral) for label in labels):
+                arrays["label_kind"] = LABELS_INTEGERS
+                arrays["label_values"] = np.asarray(labels, dtype=np.int64)
+            elif all(isinstance(label, str) for label in labels):
+                # n + 1 byte offsets into the UTF-8 text, as in the CSR graph file
+                encoded = [label.encode("utf-8") for label in labels]
+                ends = np.zeros(len(encoded) + 1, dtype=np.int64)
+                np.cumsum([len(text) for text in encoded], out=ends[1:])
+                arrays["label_kind"] = LABELS_STRINGS
+                arrays["label_values"] = ends
+                arrays["label_text"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+            else:
+                raise ValueError("only hierarchies whose labels are all integers or all strings can be saved")
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """Read a hierarchy written by save()."""
+        with np.load(path) as data:
+            parts = []
+            for name in ("up", "down"):
+                parts.append(CSRGraph(data[name + "_offsets"], data[name + "_targets"], data[name + "_weights"]))
+                parts.append(data[name + "_middle"])
+            labels = None
+            if "label_kind" in data:
+                table = LabelTable(int(data["label_kind"]), data["label_values"], data.get("label_text"))
+                labels = list(table)
+            return cls(data["rank"], *parts, labels)
+
+    def unpack(self, source, target):
+        """
+        Original vertices along the edge source -> target, expanding shortcuts.
+
+        Returns:
+        list: Vertices after source, ending with target.
+        """
+        path = []
+        stack = [(source, target)]
+        while stack:
+            source, target = stack.pop()
+            middle = self.middle.get((source, target))
+            if middle is None:
+                path.append(target)
+            else:
+                stack.append((middle, target))
+                stack.append((source, middle))
+        return path
+
+    def query(self, start, target, stats=None):
+        """
+        Shortest path between two vertices with the upward bidirectional search.
+
+        Parameters:
+        start: The starting vertex (label).
+        target: The vertex to reach (label).
+        stats (dict): Optional; receives 'settled', the vertices settled by both searches together.
+
+        Returns:
+        tuple: (distance, path), or (infinity, []) if target cannot be reached.
+        """
+        source, goal = self.ids[start], self.ids[target]
+        # Index 0 is the forward (upward) search, index 1 the backward one
+        distances = ({source: 0.0}, {goal: 0.0})
+        previous = ({source: None}, {goal: None})
+        queues = ([(0.0, source)], [(0.0, goal)])
+        adjacency = ((self.up_offsets, self.up_targets, self.up_weights),
+                     (self.down_offsets, self.down_targets, self.down_weights))
+        best = float('infinity')
+        meeting = None
+        settled = 0
+
+        while True:
+            # Advance the side whose next vertex is closer; a side is done once it reaches best
+            active = [side for side in (0, 1) if queues[side] and queues[side][0][0] < best]
+            if not active:
+                break
+            side = min(active, key=lambda side: queues[side][0][0])
+            distance, vertex = heapq.heappop(queues[side])
+            if distance > distances[side][vertex]:
+                continue
+            settled += 1
+            other = distances[1 - side].get(vertex)
+            if other is not None and distance + other < best:
+                best = distance + other
+                meeting = vertex
+
+            offsets, targets, weights = adjacency[side]
+            for edge in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = targets[edge]
+                candidate = distance + weights[edge]
+                if candidate < distances[side].get(neighbor, float('infinity')):
+                    distances[side][neighbor] = candidate
+                    previous[side][neighbor] = vertex
+                    heapq.heappush(queues[side], (candidate, neighbor))
+
+        if stats is not None:
+            stats['settled'] = settled
+        if meeting is None:
+            return float('infinity'), []
+
+        # Edges up from the start, then down to the target, each unpacked
+        path = [source]
+        chain = []
+        vertex = meeting
+        while previous[0][vertex] is not None:
+            chain.append((previous[0][vertex], vertex))
+            vertex = previous[0][vertex]
+        vertex = meeting
+        for edge in reversed(chain):
+            path += self.unpack(*edge)
+        while previous[1][vertex] is not None:
+            path += self.unpack(vertex, previous[1][vertex])
+            vertex = previous[1][vertex]
+        return best, [self.labels[vertex] for vertex in path]
+
+def edge_lists_to_csr(edge_lists):
+    """
+    Pack per-vertex lists of (neighbor, weight, middle) into a CSR graph and a middle array.
+
+    Returns:
+    tuple: (CSRGraph, numpy.ndarray of middle vertices).
+    """
+    offsets = np.zeros(len(edge_lists) + 1, dtype=np.int64)
+    np.cumsum([len(edges) for edges in edge_lists], out=offsets[1:])
+    flat = [edge for edges in edge_lists for edge in edges]
+    targets = np.array([edge[0] for edge in flat], dtype=np.int64)
+    weights = np.array([edge[1] for edge in flat], dtype=np.float64)
+    middles = np.array([edge[2] for edge in flat], dtype=np.int64)
+    return CSRGraph(offsets, targets, weights), middles
+
+# Testing Contraction Hierarchies
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('A', 1), ('C', 2), ('D', 5)],
+        'C': [('A', 4), ('B', 2), ('D', 1)],
+        'D': [('B', 5), ('C', 1)]
+    }
+    hierarchy = ContractionHierarchy.build(graph)
+    print("Contraction Hierarchy for the sample graph:")
+    print("Ranks:", {label: int(hierarchy.rank[vertex]) for vertex, label in enumerate(hierarchy.labels)})
+    print(f"Shortest path from A to D: {hierarchy.query('A', 'D')}")
+
+    # An 80 x 80 grid of two-way streets: preprocess once, then answer many queries
+    roads = grid_road_graph(80)
+    stats = {}
+    hierarchy = ContractionHierarchy.build(roads, stats=stats)
+    print(f"\n{roads.num_nodes} vertices, {roads.num_edges} edges: "
+          f"{stats['shortcuts']} shortcuts in {stats['seconds']:.1f} s")
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "roads.npz")
+        hierarchy.save(path)
+        hierarchy = ContractionHierarchy.load(path)
+
+    rng = np.random.default_rng(1)
+    queries = rng.integers(0, roads.num_nodes, (200, 2)).tolist()
+    reverse = roads.reverse()
+    for name, query in (("bidirectional dijkstra", lambda s, t, st: bidirectional_dijkstra(roads, s, t, reverse, st)),
+                        ("contraction hierarchy", hierarchy.query)):
+        settled = 0
+        start = time.perf_counter()
+        for source, target in queries:
+            stats = {}
+            query(source, target, stats)
+            settled += stats['settled']
+        elapsed = time.perf_counter() - start
+        print(f"{name:>22}: {elapsed / len(queries) * 1000:.2f} ms and "
+              f"{settled // len(queries)} vertices settled per query")
+
+# EOF
@@ -30,23 +30,52 @@ Nodes are visited in depth-first order by popping from the stack.
 Recursive DFS:
 The function uses recursion to visit each node.
 The visited set ensures that each node is only visited once.
+
+CSR Graphs:
+dfs_iterative also accepts a CSRGraph (see CSRGraph.py) and then runs dfs_iterative_csr,
+which keeps integer node ids on the stack and a bytearray of visited flags instead of a set.
+Neighbors are pushed in reverse order, so the visit order matches the dictionary version.
+
+Non-Recursive DFS Toolkit:
+dfs_recursive hits Python's recursion limit at a depth of about 1000. The functions below
+keep an explicit stack of node ids instead, plus a per-node position in its edge list,
+so a node is resumed exactly where a recursive call would have returned to it.
+They all run in O(V+E) on dictionary or CSR graphs and return the original labels.
+dfs_times: discovery and finish time of every node (one clock, 0 .. 2V-1).
+strongly_connected_components: Tarjan's algorithm; components come out in reverse topological order.
+topological_sort: reverse finish order; raises ValueError naming a cycle if there is one.
+find_cycle: a directed cycle as a list of nodes, or None.
+bridges_and_articulation_points: treats the graph as undirected (an edge listed in both
+directions counts once) and returns its bridges and cut vertices from low-link values.
 Output
 For both versions (iterative and recursive), 
 
 DFS traversal starting from A:
 ['A', 'B', 'D', 'E', 'F', 'C']
 
+DFS traversal of the CSR graph starting from A:
+['A', 'B', 'D', 'E', 'F', 'C']
+
 Recursive DFS traversal:
 A B D E F C 
 
-Recurcive version:
+Discovery/finish times: {'A': (0, 11), 'B': (1, 8), 'C': (9, 10), 'D': (2, 3), 'E': (4, 7), 'F': (5, 6)}
+Topological order: ['A', 'C', 'B', 'E', 'F', 'D']
+Bridges: [('B', 'D')]
+Articulation points: ['B']
+Strongly connected components: [['E', 'D'], ['C', 'B', 'A']]
+Cycle: ['A', 'B', 'C', 'A']
+Topological sort of a 1000000-node chain ends at node 999999
+
+"""
 
 # Depth-First Search (Recursive) Algorithm
 # Astro Pema Software (c)
 # Oba Ozai Nov 2024
 
+import numpy as np
 
-recursive
+from CSRGraph import CSRGraph
 
 def dfs_recursive(graph, node, visited=None):
     """
@@ -70,26 +99,6 @@ def dfs_recursive(graph, node, visited=None):
         if neighbor not in visited:
             dfs_recursive(graph, neighbor, visited)
 
-# Sample graph (adjacency list)
-graph = {
-    'A': ['B', 'C'],
-    'B': ['D', 'E'],
-    'C': ['F'],
-    'D': [],
-    'E': ['F'],
-    'F': []
-}
-
-# Testing the recursive DFS function
-if __name__ == "__main__":
-    start_node = 'A'
-    print("\nRecursive DFS traversal:")
-    dfs_recursive(graph, start_node)
-
-# EOF
-
-"""
-
 # Depth-First Search (Iterative) Algorithm
 # Astro Pema Software (c)
 # Oba Ozai Nov 2024
@@ -99,12 +108,16 @@ def dfs_iterative(graph, start):
     Perform Depth-First Search on a graph using a stack.
     
     Parameters:
-    graph (dict): Adjacency list representation of the graph.
+    graph (dict or CSRGraph): Adjacency list representation of the graph.
     start (str): The starting node for DFS.
     
     Returns:
     list: A list of nodes visited in DFS order.
     """
+    if isinstance(graph, CSRGraph):
+        labels = graph.labels
+        return [labels[node] for node in dfs_iterative_csr(graph, graph.id_of(start)).tolist()]
+
     visited = set()  # To keep track of visited nodes
     stack = [start]  # Stack to manage the nodes to visit
     result = []
@@ -125,6 +138,303 @@ def dfs_iterative(graph, start):
     
     return result
 
+def dfs_iterative_csr(graph, source):
+    """
+    Perform Depth-First Search on a CSR graph using a stack of integer node ids.
+
+    Parameters:
+    graph (CSRGraph): The graph.
+    source (int): Node id of the starting node.
+
+    Returns:
+    numpy.ndarray: Node ids in DFS order.
+    """
+    offsets = memoryview(graph.offsets)
+    targets = memoryview(graph.targets)
+    visited = bytearray(graph.num_nodes)
+    stack = [source]
+    result = []
+
+    while stack:
+        node = stack.pop()
+        if visited[node]:
+            continue
+        visited[node] = 1
+        result.append(node)
+        for neighbor in reversed(targets[offsets[node]:offsets[node + 1]]):
+            if not visited[neighbor]:
+                stack.append(neighbor)
+
+    return np.array(result, dtype=graph.targets.dtype)
+
+def as_csr(graph):
+    """The graph as a CSRGraph, converting a dictionary adjacency list if needed."""
+    return graph if isinstance(graph, CSRGraph) else CSRGraph.from_dict(graph)
+
+def dfs_times(graph, start=None):
+    """
+    Discovery and finish times of a Depth-First Search, without recursion.
+
+    Parameters:
+    graph (dict or CSRGraph): Adjacency list representation of the graph.
+    start (str): The starting node; when None every node is searched, in graph order.
+
+    Returns:
+    tuple: (discovery, finish) dictionaries mapping each visited node to its time.
+    """
+    csr = as_csr(graph)
+    offsets = memoryview(csr.offsets)
+    targets = memoryview(csr.targets)
+    position = csr.offsets[:-1].tolist()  # Next edge to follow from each node
+    discovery = [-1] * csr.num_nodes
+    finish = [-1] * csr.num_nodes
+    roots = range(csr.num_nodes) if start is None else [csr.id_of(start)]
+    clock = 0
+
+    for root in roots:
+        if discovery[root] >= 0:
+            continue
+        discovery[root] = clock
+        clock += 1
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            edge = position[node]
+            if edge < offsets[node + 1]:
+                position[node] = edge + 1
+                neighbor = targets[edge]
+                if discovery[neighbor] < 0:
+                    discovery[neighbor] = clock
+                    clock += 1
+                    stack.append(neighbor)
+            else:
+                stack.pop()
+                finish[node] = clock
+                clock += 1
+
+    labels = csr.labels
+    visited = [node for node in range(csr.num_nodes) if discovery[node] >= 0]
+    return ({labels[node]: discovery[node] for node in visited},
+            {labels[node]: finish[node] for node in visited})
+
+def strongly_connected_components(graph):
+    """
+    Tarjan's strongly connected components algorithm with an explicit stack.
+
+    Parameters:
+    graph (dict or CSRGraph): Adjacency list representation of the graph.
+
+    Returns:
+    list: Components as lists of nodes, in reverse topological order of the condensation.
+    """
+    csr = as_csr(graph)
+    offsets = memoryview(csr.offsets)
+    targets = memoryview(csr.targets)
+    position = csr.offsets[:-1].tolist()
+    index = [-1] * csr.num_nodes
+    low = [0] * csr.num_nodes
+    on_stack = bytearray(csr.num_nodes)
+    component_stack = []
+    components = []
+    counter = 0
+
+    for root in range(csr.num_nodes):
+        if index[root] >= 0:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        on_stack[root] = 1
+        component_stack.append(root)
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            edge = position[node]
+            if edge < offsets[node + 1]:
+                position[node] = edge + 1
+                neighbor = targets[edge]
+                if index[neighbor] < 0:
+                    index[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    on_stack[neighbor] = 1
+                    component_stack.append(neighbor)
+                    stack.append(neighbor)
+                elif on_stack[neighbor] and index[neighbor] < low[node]:
+                    low[node] = index[neighbor]
+                continue
+
+            # All edges of node are done: return to the caller
+            stack.pop()
+            if stack and low[node] < low[stack[-1]]:
+                low[stack[-1]] = low[node]
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = component_stack.pop()
+                    on_stack[member] = 0
+                    component.append(csr.labels[member])
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+def topological_order(csr):
+    """
+    Reverse DFS finish order of a CSR graph, stopping at the first cycle.
+
+    Parameters:
+    csr (CSRGraph): The graph.
+
+    Returns:
+    tuple: (order, cycle); order is a list of node ids when the graph is acyclic and cycle
+           is None, otherwise order is None and cycle lists the node ids around a cycle.
+    """
+    offsets = memoryview(csr.offsets)
+    targets = memoryview(csr.targets)
+    position = csr.offsets[:-1].tolist()
+    state = bytearray(csr.num_nodes)  # 0 = new, 1 = on the DFS stack, 2 = finished
+    finished = []
+
+    for root in range(csr.num_nodes):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            edge = position[node]
+            if edge < offsets[node + 1]:
+                position[node] = edge + 1
+                neighbor = targets[edge]
+                if state[neighbor] == 0:
+                    state[neighbor] = 1
+                    stack.append(neighbor)
+                elif state[neighbor] == 1:
+                    # A back edge: the stack from neighbor up to node is a cycle
+                    return None, stack[stack.index(neighbor):] + [neighbor]
+            else:
+                stack.pop()
+                state[node] = 2
+                finished.append(node)
+
+    finished.reverse()
+    return finished, None
+
+def topological_sort(graph):
+    """
+    Order the nodes of a directed acyclic graph so that every edge points forward.
+
+    Parameters:
+    graph (dict or CSRGraph): Adjacency list representation of the graph.
+
+    Returns:
+    list: The nodes in topological order.
+
+    Raises:
+    ValueError: If the graph has a cycle; the message names one.
+    """
+    csr = as_csr(graph)
+    order, cycle = topological_order(csr)
+    if cycle is not None:
+        raise ValueError("graph has a cycle: " + " -> ".join(str(csr.labels[node]) for node in cycle))
+    return [csr.labels[node] for node in order]
+
+def find_cycle(graph):
+    """
+    Find a directed cycle.
+
+    Parameters:
+    graph (dict or CSRGraph): Adjacency list representation of the graph.
+
+    Returns:
+    list: Nodes around a cycle, first node repeated at the end, or None if the graph is acyclic.
+    """
+    csr = as_csr(graph)
+    _, cycle = topological_order(csr)
+    return None if cycle is None else [csr.labels[node] for node in cycle]
+
+def bridges_and_articulation_points(graph):
+    """
+    Bridges and articulation points of a graph, treated as undirected.
+
+    Parameters:
+    graph (dict or CSRGraph): Adjacency list representation of the graph. An edge listed
+                              in both directions counts once; self-loops are ignored.
+
+    Returns:
+    tuple: (bridges, articulation_points); bridges is a list of (u, v) node pairs and
+           articulation_points a list of nodes, both in graph order.
+    """
+    csr = as_csr(graph)
+    n = csr.num_nodes
+
+    # One undirected edge per unordered pair, stored in both directions with a shared id
+    sources = csr.sources().astype(np.int64)
+    targets = csr.targets.astype(np.int64)
+    pairs = np.minimum(sources, targets) * n + np.maximum(sources, targets)
+    pairs = np.unique(pairs[sources != targets])
+    first, second = pairs // n, pairs % n
+    edge_from = np.concatenate([first, second])
+    edge_to = np.concatenate([second, first])
+    edge_ids = np.concatenate([np.arange(len(pairs))] * 2)
+    order = np.argsort(edge_from, kind='stable')
+    adjacency = memoryview(edge_to[order])
+    adjacency_ids = memoryview(edge_ids[order])
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(edge_from, minlength=n), out=offsets[1:])
+    position = offsets[:-1].tolist()
+    offsets = memoryview(offsets)
+
+    discovery = [-1] * n
+    low = [0] * n
+    parent_edge = [-1] * n
+    is_articulation = bytearray(n)
+    bridge_ids = []
+    clock = 0
+
+    for root in range(n):
+        if discovery[root] >= 0:
+            continue
+        discovery[root] = low[root] = clock
+        clock += 1
+        root_children = 0
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            edge = position[node]
+            if edge < offsets[node + 1]:
+                position[node] = edge + 1
+                neighbor = adjacency[edge]
+                if adjacency_ids[edge] == parent_edge[node]:
+                    continue
+                if discovery[neighbor] < 0:
+                    parent_edge[neighbor] = adjacency_ids[edge]
+                    discovery[neighbor] = low[neighbor] = clock
+                    clock += 1
+                    stack.append(neighbor)
+                elif discovery[neighbor] < low[node]:
+                    low[node] = discovery[neighbor]
+                continue
+
+            stack.pop()
+            if not stack:
+                break
+            parent = stack[-1]
+            if low[node] < low[parent]:
+                low[parent] = low[node]
+            if low[node] > discovery[parent]:
+                bridge_ids.append(parent_edge[node])
+            if parent == root:
+                root_children += 1
+            elif low[node] >= discovery[parent]:
+                is_articulation[parent] = 1
+        if root_children >= 2:
+            is_articulation[root] = 1
+
+    labels = csr.labels
+    bridges = [(labels[int(first[edge])], labels[int(second[edge])]) for edge in sorted(bridge_ids)]
+    return bridges, [labels[node] for node in range(n) if is_articulation[node]]
+
 # Sample graph (adjacency list)
 graph = {
     'A': ['B', 'C'],
@@ -135,14 +445,38 @@ graph = {
     'F': []
 }
 
-# Testing the iterative DFS function
+# Testing the iterative and recursive DFS functions
 if __name__ == "__main__":
     start_node = 'A'
     print(f"DFS traversal starting from {start_node}:")
     print(dfs_iterative(graph, start_node))
 
-# EOF
+    print(f"\nDFS traversal of the CSR graph starting from {start_node}:")
+    print(dfs_iterative(CSRGraph.from_dict(graph), start_node))
+
+    print("\nRecursive DFS traversal:")
+    dfs_recursive(graph, start_node)
 
+    discovery, finish = dfs_times(graph, start_node)
+    print("\n\nDiscovery/finish times:", {node: (discovery[node], finish[node]) for node in discovery})
+    print("Topological order:", topological_sort(graph))
+    bridges, articulation_points = bridges_and_articulation_points(graph)
+    print("Bridges:", bridges)
+    print("Articulation points:", articulation_points)
 
+    cyclic_graph = {
+        'A': ['B'],
+        'B': ['C', 'D'],
+        'C': ['A'],
+        'D': ['E'],
+        'E': ['D']
+    }
+    print("Strongly connected components:", strongly_connected_components(cyclic_graph))
+    print("Cycle:", find_cycle(cyclic_graph))
 
+    # A chain of a million nodes is far deeper than the recursion limit
+    chain = CSRGraph(np.append(np.arange(1_000_000), 999_999), np.arange(1, 1_000_000))
+    order = topological_sort(chain)
+    print(f"Topological sort of a {chain.num_nodes}-node chain ends at node {order[-1]}")
 
+# EOF
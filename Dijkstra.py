@@ -31,6 +31,67 @@ Distance Updates:
 The distances dictionary keeps track of the shortest known distance to each vertex.
 If a shorter path to a vertex is found, the distance is updated, and the vertex is added to the priority queue.
 
+CSR Graphs:
+dijkstra also accepts a weighted CSRGraph (see CSRGraph.py) and then runs dijkstra_csr,
+which keeps integer node ids in the heap and distances in a flat list indexed by id, and
+reads each node's edges from one contiguous slice of the targets and weights arrays.
+The distances are converted back to a dictionary keyed by the original labels.
+
+Indexed d-ary Heap:
+With heapq, a shorter path to a vertex pushes a second entry, and the stale one is skipped
+when it is popped. On dense graphs that lets the heap grow to O(E) entries.
+IndexedDaryHeap keeps at most one entry per vertex. Keys and vertex ids sit in two parallel
+lists laid out as a d-ary tree (children of slot i are d*i + 1 .. d*i + d), and a position
+array records each vertex's slot, so decrease_key finds the entry directly and sifts it up.
+The heap never holds more than V entries. A wider tree (d = 4) is shallower than a binary
+one, so the frequent decrease-key operations (sift up) get cheaper while pop (sift down,
+which looks at d children per level) stays cheap.
+dijkstra(graph, start, queue="indexed") and dijkstra_csr(..., queue="indexed") use it.
+benchmark_queues compares both queues on a dense random graph.
+
+Integer Weights (Dial's Buckets):
+When every weight is a small non-negative integer, for example travel seconds or hop costs,
+no comparisons are needed to find the closest vertex. dijkstra_dial keeps C + 1 buckets,
+where C is the largest weight. A vertex at distance d goes into bucket d mod (C + 1), and
+the buckets are emptied in order of distance. Each push and pop is O(1), so a run costs
+O(E + D), where D is the largest distance. Every vertex waiting in the queue is at most
+C past the current distance, so the circular array never mixes two distances in one bucket.
+The default queue="auto" picks the buckets when all weights are non-negative integers
+no larger than DIAL_MAX_WEIGHT and the distance range is small enough to pay off, and
+heapq otherwise; the distances are the same either way. D is at most C * (V - 1), so the
+buckets are chosen only when that is no more than the E log2 V a heap costs; on a long
+sparse chain with large weights, walking every distance would be far slower than heapq.
+
+Delta-Stepping:
+delta_stepping computes the same distances as dijkstra_csr with array operations spread
+over a pool of worker processes. Vertices are grouped into buckets of width delta by
+tentative distance. Edges are light (weight <= delta) or heavy. The smallest non-empty
+bucket is settled by relaxing the light edges of all its vertices at once, repeated while
+that re-fills the bucket. The heavy edges of everything the bucket settled are relaxed
+once at the end, since they can only reach later buckets.
+Each relaxation phase cuts its vertices into chunks with about equal edge counts.
+Workers read the graph and the distances from shared memory and write candidate
+(vertex, distance) requests into their own region of a shared buffer. The main process
+applies them with a minimum per vertex, which does not depend on the order, so the
+result is deterministic and equal to dijkstra_csr.
+A small delta approaches Dijkstra's Algorithm (many phases, little wasted work). A large
+delta approaches Bellman-Ford (few phases with lots of parallel work, but vertices get
+relaxed more than once). The default is the largest weight divided by the average degree.
+benchmark_delta_stepping times several deltas and process counts. As with parallel_bfs,
+a single-core machine shows no speedup from extra processes.
+
+Point-to-Point Queries:
+shortest_path stops as soon as the target is settled, because its distance is then final,
+and it rebuilds the path from the predecessor of each vertex.
+bidirectional_dijkstra runs one search forward from the start and one backward from the
+target over the reversed edges, always advancing the side with the smaller queue.
+Each time a relaxed vertex has been reached from both sides, the two distances give a
+candidate route. The search stops once the smallest keys of both queues add up to at
+least the best route found. On road-like graphs the two searches each cover roughly a
+disk of half the radius, so far fewer vertices are settled than by a one-sided search.
+Both work on dictionary and CSR graphs; the reversed graph can be passed in so repeated
+queries do not rebuild it.
+
 Output:
 The function returns a dictionary with the shortest distance from the starting vertex to each vertex in the graph.
 
@@ -42,6 +103,21 @@ Distance to B: 1
 Distance to C: 3
 Distance to D: 4
 
+Shortest paths from A on the CSR graph:
+Distance to A: 0.0
+Distance to B: 1.0
+Distance to C: 3.0
+Distance to D: 4.0
+
+Shortest paths from A with the indexed heap:
+{'A': 0, 'B': 1, 'C': 3, 'D': 4}
+
+Shortest paths from A with Dial's buckets:
+{'A': 0, 'B': 1, 'C': 3, 'D': 4}
+
+Shortest path from A to D: (4, ['A', 'B', 'C', 'D'])
+Bidirectional search from A to D: (4, ['A', 'B', 'C', 'D'])
+
 """
 
 # Dijkstra's Algorithm
@@ -49,18 +125,238 @@ Distance to D: 4
 # Oba Ozai Nov 2024
 
 import heapq
+import math
+import multiprocessing
+import numbers
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from CSRGraph import CSRGraph, gather_ranges
+
+class IndexedDaryHeap:
+    """
+    Min-priority queue over integer ids 0 .. capacity - 1 with decrease-key.
+
+    Attributes:
+    d (int): Number of children per node.
+    keys (list): Key of each heap slot.
+    ids (list): Id stored in each heap slot.
+    position (list): Heap slot of each id, or -1 if the id is not in the heap.
+    """
+
+    def __init__(self, capacity, d=4):
+        """
+        Parameters:
+        capacity (int): Ids range over 0 .. capacity - 1.
+        d (int): Number of children per node (2 or more).
+        """
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self.keys = []
+        self.ids = []
+        self.position = [-1] * capacity
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, item):
+        return self.position[item] >= 0
+
+    def key_of(self, item):
+        """Current key of an id in the heap."""
+        return self.keys[self.position[item]]
+
+    def push(self, item, key):
+        """
+        Insert an id, or lower its key if it is already in the heap.
+
+        Parameters:
+        item (int): The id.
+        key (float): Its priority.
+
+        Returns:
+        bool: True if the heap changed (new id or lower key).
+        """
+        slot = self.position[item]
+        if slot < 0:
+            slot = len(self.ids)
+            self.keys.append(key)
+            self.ids.append(item)
+        elif key < self.keys[slot]:
+            self.keys[slot] = key
+        else:
+            return False
+        self.sift_up(slot, item, key)
+        return True
+
+    def decrease_key(self, item, key):
+        """Lower the key of an id already in the heap."""
+        slot = self.position[item]
+        if slot < 0 or key > self.keys[slot]:
+            raise ValueError("decrease_key needs an id in the heap and a key no larger than its own")
+        self.sift_up(slot, item, key)
+
+    def pop(self):
+        """
+        Remove the id with the smallest key.
+
+        Returns:
+        tuple: (id, key).
+        """
+        keys, ids, position = self.keys, self.ids, self.position
+        top_item, top_key = ids[0], keys[0]
+        position[top_item] = -1
+        last_item, last_key = ids.pop(), keys.pop()
+        if ids:
+            self.sift_down(0, last_item, last_key)
+        return top_item, top_key
+
+    def sift_up(self, slot, item, key):
+        """Move item (with key) from slot towards the root until its parent is not larger."""
+        keys, ids, position, d = self.keys, self.ids, self.position, self.d
+        while slot:
+            parent = (slot - 1) // d
+            if keys[parent] <= key:
+                break
+            keys[slot] = keys[parent]
+            ids[slot] = ids[parent]
+            position[ids[slot]] = slot
+            slot = parent
+        keys[slot] = key
+        ids[slot] = item
+        position[item] = slot
+
+    def sift_down(self, slot, item, key):
+        """Place item (with key) at slot and move it down until no child is smaller."""
+        keys, ids, position, d = self.keys, self.ids, self.position, self.d
+        size = len(ids)
+        while True:
+            first = d * slot + 1
+            if first >= size:
+                break
+            last = min(first + d, size)
+            child = first
+            child_key = keys[first]
+            for other in range(first + 1, last):
+                if keys[other] < child_key:
+                    child, child_key = other, keys[other]
+            if key <= child_key:
+                break
+            keys[slot] = child_key
+            ids[slot] = ids[child]
+            position[ids[slot]] = slot
+            slot = child
+        keys[slot] = key
+        ids[slot] = item
+        position[item] = slot
+
+DIAL_MAX_WEIGHT = 1024
+
+def dial_weight_bound(weights):
+    """
+    Largest weight if every weight is a non-negative integer no larger than DIAL_MAX_WEIGHT.
+
+    Parameters:
+    weights (iterable or numpy.ndarray): All edge weights of a graph.
+
+    Returns:
+    int: The largest weight, or None if Dial's buckets do not apply.
+    """
+    if isinstance(weights, np.ndarray):
+        if len(weights) == 0:
+            return 0
+        if weights.min() < 0 or weights.max() > DIAL_MAX_WEIGHT or not np.all(weights == np.floor(weights)):
+            return None
+        return int(weights.max())
+    largest = 0
+    for weight in weights:
+        # The type check skips the slow numbers.Integral test for plain ints
+        if type(weight) is not int and not isinstance(weight, numbers.Integral):
+            return None
+        if not 0 <= weight <= DIAL_MAX_WEIGHT:
+            return None
+        if weight > largest:
+            largest = weight
+    return int(largest)
+
+def dial_pays_off(max_weight, num_vertices, num_edges):
+    """
+    Whether Dial's buckets should beat a binary heap on a graph of this size.
+
+    The buckets step through every distance up to the largest one, which is at most
+    max_weight * (V - 1); the heap costs about E log2 V.
+
+    Parameters:
+    max_weight (int): Largest edge weight.
+    num_vertices (int): Number of vertices V.
+    num_edges (int): Number of edges E.
+
+    Returns:
+    bool: True if the distance range is no larger than the heap's cost.
+    """
+    return max_weight * max(num_vertices - 1, 0) <= max(num_edges, 1) * math.log2(max(num_vertices, 2))
+
+def choose_queue(queue, weights, num_vertices, num_edges):
+    """
+    Resolve queue="auto" to "buckets" or "heapq" and return (queue, largest weight or None).
+
+    "auto" is deliberately biased towards heapq. dial_pays_off compares the worst-case
+    distance range, max_weight * (V - 1), with E log2 V. The real range is usually much
+    smaller, but estimating it would take a traversal of its own. A wrong guess towards
+    the buckets can be hundreds of times slower (a long chain), while a wrong guess towards
+    heapq costs at most the speedup the buckets would have given. In practice "auto" picks the
+    buckets for graphs with about as many edges as a grid and weights up to a few times log2 V
+    (up to about 65 on a 300 x 300 grid). Pass queue="buckets" to use them regardless.
+
+    Parameters:
+    queue (str): "heapq", "indexed", "buckets" or "auto".
+    weights (iterable or numpy.ndarray): All edge weights of the graph.
+    num_vertices (int): Number of vertices V.
+    num_edges (int): Number of edges E.
+
+    Returns:
+    tuple: (queue, largest weight if the buckets are used, else None).
+    """
+    if queue not in ("auto", "heapq", "indexed", "buckets"):
+        raise ValueError(f"Unknown queue: {queue!r}")
+    if queue not in ("auto", "buckets"):
+        return queue, None
+    bound = dial_weight_bound(weights)
+    if bound is None:
+        if queue == "buckets":
+            raise ValueError(f"Dial's buckets need integer weights between 0 and {DIAL_MAX_WEIGHT}")
+        return "heapq", None
+    if queue == "auto" and not dial_pays_off(bound, num_vertices, num_edges):
+        return "heapq", None
+    return "buckets", bound
 
-def dijkstra(graph, start):
+def dijkstra(graph, start, queue="auto"):
     """
     Function to find the shortest path from a starting vertex to all other vertices using Dijkstra's Algorithm.
     
     Parameters:
-    graph (dict): A dictionary representing the graph where keys are vertices and values are lists of tuples (neighbor, weight).
+    graph (dict or CSRGraph): A dictionary representing the graph where keys are vertices and values are lists of tuples (neighbor, weight).
     start (str): The starting vertex.
+    queue (str): "heapq" (lazy deletion), "indexed" (IndexedDaryHeap with decrease-key),
+                 "buckets" (Dial's buckets, small integer weights only) or "auto"
+                 (buckets when the weights allow it and dial_pays_off, heapq otherwise).
     
     Returns:
     dict: A dictionary of shortest distances from the starting vertex to each other vertex.
     """
+    if isinstance(graph, CSRGraph):
+        return dict(zip(graph.labels, dijkstra_csr(graph, graph.id_of(start), queue).tolist()))
+    num_edges = sum(len(edges) for edges in graph.values())
+    queue, max_weight = choose_queue(queue, (weight for edges in graph.values() for _, weight in edges),
+                                     len(graph), num_edges)
+    if queue == "buckets":
+        return dijkstra_dial(graph, start, max_weight)
+    if queue == "indexed":
+        return dijkstra_indexed(graph, start)
+
     # Initialize distances with infinity for all vertices except the start vertex
     distances = {vertex: float('infinity') for vertex in graph}
     distances[start] = 0
@@ -87,6 +383,584 @@ def dijkstra(graph, start):
     
     return distances
 
+def dijkstra_indexed(graph, start, d=4):
+    """
+    Dijkstra's Algorithm on a dictionary graph with an IndexedDaryHeap instead of heapq.
+
+    Parameters:
+    graph (dict): Vertices mapped to lists of (neighbor, weight) tuples.
+    start (str): The starting vertex.
+    d (int): Number of children per heap node.
+
+    Returns:
+    dict: A dictionary of shortest distances from the starting vertex to each other vertex.
+    """
+    vertices = list(graph)
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    distances = {vertex: float('infinity') for vertex in graph}
+    distances[start] = 0
+
+    priority_queue = IndexedDaryHeap(len(vertices), d)
+    priority_queue.push(index[start], 0)
+    while priority_queue:
+        current, current_distance = priority_queue.pop()
+        for neighbor, weight in graph[vertices[current]]:
+            distance = current_distance + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                priority_queue.push(index[neighbor], distance)
+
+    return distances
+
+def dijkstra_dial(graph, start, max_weight):
+    """
+    Dijkstra's Algorithm with Dial's circular bucket queue, for integer weights 0 .. max_weight.
+
+    Parameters:
+    graph (dict): Vertices mapped to lists of (neighbor, weight) tuples.
+    start (str): The starting vertex.
+    max_weight (int): Largest edge weight.
+
+    Returns:
+    dict: A dictionary of shortest distances from the starting vertex to each other vertex.
+    """
+    distances = {vertex: float('infinity') for vertex in graph}
+    distances[start] = 0
+    buckets = [[] for _ in range(max_weight + 1)]
+    buckets[0].append(start)
+    waiting = 1
+    current_distance = 0
+
+    while waiting:
+        bucket = buckets[current_distance % len(buckets)]
+        while bucket:       # Zero-weight edges may refill the bucket being emptied
+            current_vertex = bucket.pop()
+            waiting -= 1
+            if distances[current_vertex] != current_distance:
+                continue    # Moved to a closer bucket since it was put here
+            for neighbor, weight in graph[current_vertex]:
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    buckets[distance % len(buckets)].append(neighbor)
+                    waiting += 1
+        current_distance += 1
+
+    return distances
+
+def dijkstra_csr(graph, source, queue="auto", d=4, stats=None):
+    """
+    Dijkstra's Algorithm on a weighted CSR graph using integer node ids.
+
+    Parameters:
+    graph (CSRGraph): The graph; graph.weights must not be None.
+    source (int): Node id of the starting vertex.
+    queue (str): "heapq", "indexed", "buckets" or "auto", as for dijkstra.
+    d (int): Number of children per heap node for the indexed queue.
+    stats (dict): Optional; receives 'pushes' and 'max_queue', the largest queue size.
+
+    Returns:
+    numpy.ndarray: Shortest distance to each node id (infinity if unreachable).
+    """
+    if graph.weights is None:
+        raise ValueError("dijkstra needs a weighted CSR graph")
+    queue, max_weight = choose_queue(queue, graph.weights, graph.num_nodes, graph.num_edges)
+    offsets = memoryview(graph.offsets)
+    targets = memoryview(graph.targets)
+    weights = memoryview(graph.weights)
+    distances = [float('infinity')] * graph.num_nodes
+    distances[source] = 0.0
+    pushes = 1
+    max_queue = 1
+
+    if queue == "buckets":
+        # Integer arithmetic throughout; the distances are turned back into floats at the end
+        integer_weights = graph.weights.astype(np.int64).tolist()
+        size = max_weight + 1
+        buckets = [[] for _ in range(size)]
+        buckets[0].append(source)
+        distances[source] = 0
+        waiting = 1
+        current_distance = 0
+        while waiting:
+            bucket = buckets[current_distance % size]
+            while bucket:
+                node = bucket.pop()
+                waiting -= 1
+                if distances[node] != current_distance:
+                    continue
+                for edge in range(offsets[node], offsets[node + 1]):
+                    neighbor = targets[edge]
+                    distance = current_distance + integer_weights[edge]
+                    if distance < distances[neighbor]:
+                        distances[neighbor] = distance
+                        buckets[distance % size].append(neighbor)
+                        waiting += 1
+                        pushes += 1
+                if stats is not None and waiting > max_queue:
+                    max_queue = waiting
+            current_distance += 1
+    elif queue == "indexed":
+        priority_queue = IndexedDaryHeap(graph.num_nodes, d)
+        priority_queue.push(source, 0.0)
+        push = priority_queue.push
+        pop = priority_queue.pop
+        while priority_queue:
+            node, current_distance = pop()
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[edge]
+                distance = current_distance + weights[edge]
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    push(neighbor, distance)
+                    pushes += 1
+            if stats is not None and len(priority_queue) > max_queue:
+                max_queue = len(priority_queue)
+    else:
+        priority_queue = [(0.0, source)]
+        while priority_queue:
+            current_distance, node = heapq.heappop(priority_queue)
+            if current_distance > distances[node]:
+                continue
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[edge]
+                distance = current_distance + weights[edge]
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    heapq.heappush(priority_queue, (distance, neighbor))
+                    pushes += 1
+            if stats is not None and len(priority_queue) > max_queue:
+                max_queue = len(priority_queue)
+
+    if stats is not None:
+        stats['pushes'] = pushes
+        stats['max_queue'] = max_queue
+    return np.array(distances, dtype=np.float64)
+
+def relax_requests(arrays, start, end, out_start, light, delta):
+    """
+    Relaxation requests of the light or heavy edges of active[start:end].
+
+    Parameters:
+    arrays (dict): "offsets", "targets", "weights", "distances", "active",
+                   "request_nodes" and "request_distances" arrays.
+    start, end (int): Slice of the active vertices.
+    out_start (int): First output index; the slice has room for all of its out-edges.
+    light (bool): Relax edges with weight <= delta, or the heavier ones.
+    delta (float): Bucket width.
+
+    Returns:
+    int: Number of requests written (only those that beat the current distance).
+    """
+    offsets, targets, weights = arrays["offsets"], arrays["targets"], arrays["weights"]
+    distances = arrays["distances"]
+    nodes = arrays["active"][start:end]
+    edges = gather_ranges(offsets[nodes], offsets[nodes + 1])
+    sources = np.repeat(nodes, offsets[nodes + 1] - offsets[nodes])
+    edge_weights = weights[edges]
+    mask = edge_weights <= delta if light else edge_weights > delta
+    neighbors = targets[edges[mask]]
+    candidates = distances[sources[mask]] + edge_weights[mask]
+    keep = candidates < distances[neighbors]
+    count = int(keep.sum())
+    arrays["request_nodes"][out_start:out_start + count] = neighbors[keep]
+    arrays["request_distances"][out_start:out_start + count] = candidates[keep]
+    return count
+
+def attach_sssp_arrays(specs):
+    """Pool initializer: map the shared delta-stepping arrays into this worker process."""
+    global sssp_memories, sssp_arrays
+    sssp_memories = []
+    sssp_arrays = {}
+    for key, (name, dtype, size) in specs.items():
+        memory = shared_memory.SharedMemory(name=name)
+        sssp_memories.append(memory)
+        sssp_arrays[key] = np.ndarray(size, dtype=dtype, buffer=memory.buf)
+
+def relax_requests_task(task):
+    """Pool task: requests for one (start, end, out_start, light, delta) chunk."""
+    return relax_requests(sssp_arrays, *task)
+
+def delta_stepping(graph, source, delta=None, processes=None, chunks_per_process=4,
+                   min_parallel_edges=100_000, stats=None):
+    """
+    Single-source shortest paths by delta-stepping, with relaxations spread over worker processes.
+
+    Parameters:
+    graph (CSRGraph): The graph, with non-negative weights.
+    source (int): Node id of the starting vertex.
+    delta (float): Bucket width; the largest weight / the average degree by default.
+    processes (int): Number of worker processes, os.cpu_count() by default; 1 runs in this process.
+    chunks_per_process (int): Chunks per process and phase, for load balance.
+    min_parallel_edges (int): Phases with fewer edges to scan run in this process.
+    stats (dict): Optional; receives 'delta', 'buckets' and 'phases'.
+
+    Returns:
+    numpy.ndarray: Shortest distance to each node id (infinity if unreachable), as dijkstra_csr.
+    """
+    if graph.weights is None:
+        raise ValueError("delta-stepping needs a weighted CSR graph")
+    if graph.num_edges and graph.weights.min() < 0:
+        raise ValueError("delta-stepping needs non-negative weights")
+    n, m = graph.num_nodes, graph.num_edges
+    if delta is None:
+        largest = float(graph.weights.max()) if m else 0.0
+        delta = largest / max(m / max(n, 1), 1.0) or 1.0
+    if delta <= 0:
+        raise ValueError("delta must be positive")
+    out_degree = np.diff(graph.offsets)
+    processes = processes or multiprocessing.cpu_count()
+    sizes = {"offsets": (np.int64, n + 1), "targets": (graph.targets.dtype, m),
+             "weights": (np.float64, m), "distances": (np.float64, n),
+             "active": (graph.targets.dtype, n),
+             "request_nodes": (graph.targets.dtype, m), "request_distances": (np.float64, m)}
+
+    memories = {}
+    arrays = {}
+    pool = None
+    try:
+        for key, (dtype, size) in sizes.items():
+            memory = shared_memory.SharedMemory(create=True, size=max(np.dtype(dtype).itemsize * size, 1))
+            memories[key] = memory
+            arrays[key] = np.ndarray(size, dtype=dtype, buffer=memory.buf)
+        arrays["offsets"][:] = graph.offsets
+        arrays["targets"][:] = graph.targets
+        arrays["weights"][:] = graph.weights
+        distances = arrays["distances"]
+        distances[:] = np.inf
+        distances[source] = 0.0
+        if processes > 1:
+            specs = {key: (memories[key].name, sizes[key][0], sizes[key][1]) for key in sizes}
+            pool = multiprocessing.Pool(processes, initializer=attach_sssp_arrays, initargs=(specs,))
+
+        def relax(nodes, light):
+            """Relax the light or heavy edges of nodes; returns the vertices whose distance dropped."""
+            arrays["active"][:len(nodes)] = nodes
+            edge_ends = np.cumsum(out_degree[nodes])
+            total = int(edge_ends[-1])
+            if pool is None or total < min_parallel_edges:
+                tasks = [(0, len(nodes), 0, light, delta)]
+            else:
+                num_chunks = min(len(nodes), processes * chunks_per_process)
+                cuts = np.searchsorted(edge_ends, np.arange(1, num_chunks) * total // num_chunks, side='right')
+                bounds = np.unique(np.concatenate([[0], cuts, [len(nodes)]]))
+                tasks = [(int(start), int(end), int(edge_ends[start - 1]) if start else 0, light, delta)
+                         for start, end in zip(bounds[:-1], bounds[1:])]
+            if len(tasks) == 1:
+                counts = [relax_requests(arrays, *tasks[0])]
+            else:
+                counts = pool.map(relax_requests_task, tasks, chunksize=1)
+
+            requested = np.concatenate([arrays["request_nodes"][task[2]:task[2] + count]
+                                        for task, count in zip(tasks, counts)])
+            offered = np.concatenate([arrays["request_distances"][task[2]:task[2] + count]
+                                      for task, count in zip(tasks, counts)])
+            touched = np.unique(requested)
+            before = distances[touched]
+            np.minimum.at(distances, requested, offered)  # Order-independent, so deterministic
+            return touched[distances[touched] < before]
+
+        pending = np.array([source], dtype=graph.targets.dtype)
+        buckets = 0
+        phases = 0
+        while pending.size:
+            bucket = np.floor(distances[pending].min() / delta)
+            buckets += 1
+            settled = []
+            while True:
+                in_bucket = np.floor(distances[pending] / delta) == bucket
+                active = pending[in_bucket]
+                if not active.size:
+                    break
+                pending = pending[~in_bucket]
+                settled.append(active)
+                pending = np.union1d(pending, relax(active, light=True))
+                phases += 1
+            pending = np.union1d(pending, relax(np.unique(np.concatenate(settled)), light=False))
+            phases += 1
+
+        if stats is not None:
+            stats['delta'] = delta
+            stats['buckets'] = buckets
+            stats['phases'] = phases
+        return distances.copy()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        arrays.clear()  # The views must go before the blocks can be closed
+        for memory in memories.values():
+            memory.close()
+            memory.unlink()
+
+def benchmark_delta_stepping(graph, source=0, deltas=None, process_counts=None):
+    """
+    Time delta_stepping for several bucket widths and process counts against dijkstra_csr.
+
+    Parameters:
+    graph (CSRGraph): The graph.
+    source (int): Node id of the starting vertex.
+    deltas (list): Bucket widths to try; the default and two multiples of it by default.
+    process_counts (list): Process counts to try; 1, 2, 4, ... up to os.cpu_count() by default.
+
+    Returns:
+    dict: Seconds per run for each (delta, processes) pair, plus "dijkstra".
+    """
+    if process_counts is None:
+        process_counts = [1]
+        while process_counts[-1] * 2 <= multiprocessing.cpu_count():
+            process_counts.append(process_counts[-1] * 2)
+    start = time.perf_counter()
+    reference = dijkstra_csr(graph, source)
+    timings = {"dijkstra": time.perf_counter() - start}
+    if deltas is None:
+        stats = {}
+        delta_stepping(graph, source, processes=1, stats=stats)
+        deltas = [stats['delta'] / 4, stats['delta'], stats['delta'] * 4]
+
+    print(f"{graph.num_nodes} vertices, {graph.num_edges} edges, {multiprocessing.cpu_count()} cores")
+    print(f"dijkstra_csr: {timings['dijkstra'] * 1000:.1f} ms")
+    for delta in deltas:
+        for processes in process_counts:
+            stats = {}
+            start = time.perf_counter()
+            distances = delta_stepping(graph, source, delta, processes, stats=stats)
+            timings[(delta, processes)] = time.perf_counter() - start
+            assert np.array_equal(distances, reference)
+            print(f"delta {delta:7.2f}, {processes:>2} processes: {timings[(delta, processes)] * 1000:8.1f} ms, "
+                  f"{stats['buckets']} buckets, {stats['phases']} phases")
+    return timings
+
+def reverse_graph(graph):
+    """
+    Turn every edge of a dictionary graph around.
+
+    Parameters:
+    graph (dict): Vertices mapped to lists of (neighbor, weight) tuples.
+
+    Returns:
+    dict: The reversed graph in the same format, with every vertex as a key.
+    """
+    reverse = {vertex: [] for vertex in graph}
+    for vertex, edges in graph.items():
+        for neighbor, weight in edges:
+            reverse.setdefault(neighbor, []).append((vertex, weight))
+    return reverse
+
+def csr_neighbors(graph):
+    """Function returning the (neighbor id, weight) pairs of a node id of a weighted CSR graph."""
+    if graph.weights is None:
+        raise ValueError("dijkstra needs a weighted CSR graph")
+    offsets = memoryview(graph.offsets)
+    targets = memoryview(graph.targets)
+    weights = memoryview(graph.weights)
+    return lambda node: zip(targets[offsets[node]:offsets[node + 1]], weights[offsets[node]:offsets[node + 1]])
+
+def trace_route(previous, vertex):
+    """Follow predecessor links from vertex back to the search root; returns root .. vertex."""
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = previous[vertex]
+    path.reverse()
+    return path
+
+def dijkstra_to_target(neighbors, start, target, stats=None):
+    """
+    Dijkstra's Algorithm from start that stops when target is settled.
+
+    Parameters:
+    neighbors (callable): neighbors(vertex) gives the (neighbor, weight) pairs of a vertex.
+    start: The starting vertex.
+    target: The vertex to reach.
+    stats (dict): Optional; receives 'settled', the number of vertices settled.
+
+    Returns:
+    tuple: (distance, path), or (infinity, []) if target cannot be reached.
+    """
+    distances = {start: 0}
+    previous = {start: None}
+    settled = set()
+    priority_queue = [(0, start)]
+
+    while priority_queue:
+        current_distance, current_vertex = heapq.heappop(priority_queue)
+        if current_vertex in settled:
+            continue
+        settled.add(current_vertex)
+        if current_vertex == target:
+            break
+        for neighbor, weight in neighbors(current_vertex):
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = distance
+                previous[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    if stats is not None:
+        stats['settled'] = len(settled)
+    if target not in settled:
+        return float('infinity'), []
+    return distances[target], trace_route(previous, target)
+
+def bidirectional_search(forward, backward, start, target, stats=None):
+    """
+    Bidirectional Dijkstra: search forward from start and backward from target until they meet.
+
+    Parameters:
+    forward (callable): forward(vertex) gives the (neighbor, weight) pairs of a vertex.
+    backward (callable): backward(vertex) gives the (predecessor, weight) pairs of a vertex.
+    start: The starting vertex.
+    target: The vertex to reach.
+    stats (dict): Optional; receives 'settled', the vertices settled by both searches together.
+
+    Returns:
+    tuple: (distance, path), or (infinity, []) if target cannot be reached.
+    """
+    if start == target:
+        if stats is not None:
+            stats['settled'] = 1
+        return 0, [start]
+    # Index 0 is the forward search, index 1 the backward search
+    distances = ({start: 0}, {target: 0})
+    previous = ({start: None}, {target: None})
+    settled = (set(), set())
+    queues = ([(0, start)], [(0, target)])
+    adjacency = (forward, backward)
+    best = float('infinity')
+    meeting = None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        current_distance, current_vertex = heapq.heappop(queues[side])
+        if current_vertex in settled[side]:
+            continue
+        settled[side].add(current_vertex)
+        here, there = distances[side], distances[1 - side]
+
+        for neighbor, weight in adjacency[side](current_vertex):
+            distance = current_distance + weight
+            if distance < here.get(neighbor, float('infinity')):
+                here[neighbor] = distance
+                previous[side][neighbor] = current_vertex
+                heapq.heappush(queues[side], (distance, neighbor))
+                # A route through neighbor is known once both searches have reached it
+                if neighbor in there and distance + there[neighbor] < best:
+                    best = distance + there[neighbor]
+                    meeting = neighbor
+
+    if stats is not None:
+        stats['settled'] = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return float('infinity'), []
+    return best, trace_route(previous[0], meeting) + trace_route(previous[1], meeting)[::-1][1:]
+
+def shortest_path(graph, start, target, stats=None):
+    """
+    Shortest path between two vertices, stopping as soon as the target is settled.
+
+    Parameters:
+    graph (dict or CSRGraph): Vertices mapped to lists of (neighbor, weight) tuples.
+    start (str): The starting vertex.
+    target (str): The vertex to reach.
+    stats (dict): Optional; receives 'settled', the number of vertices settled.
+
+    Returns:
+    tuple: (distance, path) with path a list of vertices from start to target,
+           or (infinity, []) if target cannot be reached.
+    """
+    if isinstance(graph, CSRGraph):
+        distance, path = dijkstra_to_target(csr_neighbors(graph), graph.id_of(start),
+                                            graph.id_of(target), stats)
+        return distance, [graph.labels[node] for node in path]
+    return dijkstra_to_target(graph.__getitem__, start, target, stats)
+
+def bidirectional_dijkstra(graph, start, target, reverse=None, stats=None):
+    """
+    Shortest path between two vertices with a forward and a backward search that meet in the middle.
+
+    Parameters:
+    graph (dict or CSRGraph): Vertices mapped to lists of (neighbor, weight) tuples.
+    start (str): The starting vertex.
+    target (str): The vertex to reach.
+    reverse (dict or CSRGraph): reverse_graph(graph) or graph.reverse(), built when None.
+    stats (dict): Optional; receives 'settled', the vertices settled by both searches together.
+
+    Returns:
+    tuple: (distance, path) with path a list of vertices from start to target,
+           or (infinity, []) if target cannot be reached.
+    """
+    if isinstance(graph, CSRGraph):
+        reverse = graph.reverse() if reverse is None else reverse
+        distance, path = bidirectional_search(csr_neighbors(graph), csr_neighbors(reverse),
+                                              graph.id_of(start), graph.id_of(target), stats)
+        return distance, [graph.labels[node] for node in path]
+    reverse = reverse_graph(graph) if reverse is None else reverse
+    return bidirectional_search(graph.__getitem__, lambda vertex: reverse.get(vertex, ()),
+                                start, target, stats)
+
+def grid_road_graph(size, seed=0):
+    """
+    Road-like test graph: a size x size grid with random travel times on two-way streets.
+
+    Parameters:
+    size (int): Vertices per side.
+    seed (int): Random seed for the travel times.
+
+    Returns:
+    CSRGraph: Vertex id row * size + column.
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(size * size).reshape(size, size)
+    pairs = np.concatenate([
+        np.stack([ids[:, :-1].ravel(), ids[:, 1:].ravel()], axis=1),
+        np.stack([ids[:-1, :].ravel(), ids[1:, :].ravel()], axis=1),
+    ])
+    times = rng.integers(1, 10, len(pairs)).astype(np.float64)
+    sources = np.concatenate([pairs[:, 0], pairs[:, 1]])
+    targets = np.concatenate([pairs[:, 1], pairs[:, 0]])
+    weights = np.concatenate([times, times])
+    order = np.argsort(sources, kind='stable')
+    offsets = np.zeros(size * size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=size * size), out=offsets[1:])
+    return CSRGraph(offsets, targets[order], weights[order])
+
+def benchmark_queues(num_nodes=2_000, degree=200, seed=0):
+    """
+    Time dijkstra_csr with the lazy heapq queue and the indexed d-ary heap on a dense random graph.
+
+    Parameters:
+    num_nodes (int): Number of vertices.
+    degree (int): Out-edges per vertex.
+    seed (int): Random seed for the graph.
+
+    Returns:
+    dict: Seconds per run and largest queue size for each queue.
+    """
+    rng = np.random.default_rng(seed)
+    offsets = np.arange(num_nodes + 1) * degree
+    graph = CSRGraph(offsets, rng.integers(0, num_nodes, num_nodes * degree),
+                     rng.random(num_nodes * degree))
+
+    results = {}
+    reference = None
+    for queue, d in (("heapq", None), ("indexed", 2), ("indexed", 4), ("indexed", 8)):
+        stats = {}
+        start = time.perf_counter()
+        distances = dijkstra_csr(graph, 0, queue, d=d or 4, stats=stats)
+        elapsed = time.perf_counter() - start
+        reference = distances if reference is None else reference
+        assert np.array_equal(distances, reference)
+        name = queue if d is None else f"{queue} d={d}"
+        results[name] = (elapsed, stats['max_queue'])
+
+    print(f"{num_nodes} vertices, {num_nodes * degree} edges")
+    for name, (elapsed, max_queue) in results.items():
+        print(f"{name:>12}: {elapsed * 1000:7.1f} ms, largest queue {max_queue} entries")
+    return results
+
 # Testing Dijkstra's Algorithm
 if __name__ == "__main__":
     # Define a sample graph as an adjacency list
@@ -105,4 +979,51 @@ if __name__ == "__main__":
     for vertex, distance in shortest_paths.items():
         print(f"Distance to {vertex}: {distance}")
 
+    print(f"\nShortest paths from {start_vertex} on the CSR graph:")
+    for vertex, distance in dijkstra(CSRGraph.from_dict(graph), start_vertex).items():
+        print(f"Distance to {vertex}: {distance}")
+
+    print(f"\nShortest paths from {start_vertex} with the indexed heap:")
+    print(dijkstra(graph, start_vertex, queue="indexed"))
+
+    print(f"\nShortest paths from {start_vertex} with Dial's buckets:")
+    print(dijkstra(graph, start_vertex, queue="buckets"))
+
+    # Integer travel times: the default queue="auto" picks the buckets
+    roads = grid_road_graph(300)
+    assert choose_queue("auto", roads.weights, roads.num_nodes, roads.num_edges)[0] == "buckets"
+    # ...but not on a long chain, where stepping through every distance would be far slower
+    chain = CSRGraph.from_dict({vertex: [(vertex + 1, 1000)] for vertex in range(19999)})
+    assert choose_queue("auto", chain.weights, chain.num_nodes, chain.num_edges)[0] == "heapq"
+    for queue in ("heapq", "auto"):
+        start = time.perf_counter()
+        distances = dijkstra_csr(roads, 0, queue)
+        elapsed = time.perf_counter() - start
+        print(f"{queue:>5} queue on {roads.num_nodes} vertices: {elapsed * 1000:.1f} ms, farthest {distances.max()}")
+
+    print(f"\nShortest path from A to D: {shortest_path(graph, 'A', 'D')}")
+    print(f"Bidirectional search from A to D: {bidirectional_dijkstra(graph, 'A', 'D')}")
+
+    reverse = roads.reverse()
+    source, target = 150 * 300 + 100, 150 * 300 + 200
+    for name, query in (("full dijkstra", lambda stats: (dijkstra_csr(roads, source)[target], None)),
+                        ("early exit", lambda stats: shortest_path(roads, source, target, stats)),
+                        ("bidirectional", lambda stats: bidirectional_dijkstra(roads, source, target, reverse, stats))):
+        stats = {'settled': roads.num_nodes}
+        start = time.perf_counter()
+        distance, path = query(stats)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>14}: distance {distance}, {stats['settled']} vertices settled, {elapsed * 1000:.1f} ms")
+
+    print()
+    benchmark_queues()
+
+    # Delta-stepping on a random graph with real-valued weights
+    rng = np.random.default_rng(2)
+    nodes, edges = 200_000, 2_000_000
+    offsets = np.searchsorted(np.sort(rng.integers(0, nodes, edges)), np.arange(nodes + 1))
+    network = CSRGraph(offsets, rng.integers(0, nodes, edges), rng.random(edges) * 10)
+    print()
+    benchmark_delta_stepping(network, 0, process_counts=sorted({1, 2, multiprocessing.cpu_count()}))
+
 # EOF